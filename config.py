@@ -48,6 +48,13 @@ class DownloadConfig(BaseSettings):
         ge=1,
         le=60
     )
+    
+    # Whisper resamples to 16 kHz mono, so a ~70 kbps Opus track transcribes
+    # identically to the 160 kbps one at well under half the bytes
+    audio_format: str = Field(
+        default="bestaudio[acodec=opus][abr<=80]/bestaudio/best",
+        description="yt-dlp format selector for the audio download"
+    )
 
 
 class TranscriptionConfig(BaseSettings):
@@ -76,16 +83,90 @@ class TranscriptionConfig(BaseSettings):
     
     # Whisper model configuration
     whisper_model: str = Field(
-        default="base",
-        description="Whisper model to use for transcription"
+        default="auto",
+        description="Whisper model to use for transcription (auto: for English, distil-large-v3 "
+                    "on a faster-whisper GPU setup and distil-small.en on faster-whisper CPU; "
+                    "base otherwise)"
     )
     
+    @validator('whisper_model', pre=True)
+    def validate_legacy_whisper_model(cls, v):
+        """Support backward compatibility for WHISPER_MODEL"""
+        if v != "auto":  # If not default
+            return v
+        return os.getenv('WHISPER_MODEL') or v
+    
     @validator('whisper_model')
     def validate_whisper_model(cls, v):
-        valid_models = ["tiny", "base", "small", "medium", "large"]
+        valid_models = ["auto", "tiny", "base", "small", "medium", "large", "large-v3",
+                        "distil-small.en", "distil-large-v3"]
         if v not in valid_models:
             raise ValueError(f"Whisper model must be one of {valid_models}")
         return v
+    
+    language: Optional[str] = Field(
+        default=None,
+        description="Spoken language code (e.g. en); skips language detection, and 'en' "
+                    "selects the English-only .en model variants"
+    )
+    
+    @validator('language', pre=True)
+    def validate_language(cls, v):
+        """Support backward compatibility for WHISPER_LANG"""
+        if v is not None:
+            return v or None
+        return os.getenv('WHISPER_LANG') or None
+    
+    # YouTube's own captions make Whisper unnecessary when present
+    use_captions: bool = Field(
+        default=True,
+        description="Use the video's YouTube captions when available instead of transcribing audio"
+    )
+    
+    caption_language: str = Field(
+        default="en",
+        description="Caption language code to look for (regional variants like en-US also match; "
+                    "transcription.language overrides it when set)"
+    )
+    
+    # Inference backend: faster-whisper (CTranslate2) is preferred when installed
+    backend: str = Field(
+        default="auto",
+        description="Transcription backend (auto, faster-whisper, whisper-cpp or openai-whisper)"
+    )
+    
+    @validator('backend')
+    def validate_backend(cls, v):
+        valid_backends = ["auto", "faster-whisper", "whisper-cpp", "openai-whisper"]
+        if v not in valid_backends:
+            raise ValueError(f"Transcription backend must be one of {valid_backends}")
+        return v
+    
+    batch_size: int = Field(
+        default=16,
+        description="Speech windows decoded per batch on faster-whisper (1 disables batching)",
+        ge=1,
+        le=64
+    )
+    
+    vad_filter: bool = Field(
+        default=True,
+        description="Skip non-speech audio with Silero VAD before decoding (faster-whisper; "
+                    "disabling it also disables batching)"
+    )
+    
+    compile_encoder: bool = Field(
+        default=False,
+        description="Compile the Whisper encoder with torch.compile on CUDA (openai-whisper)"
+    )
+    
+    workers: int = Field(
+        default=1,
+        description="Model instances transcribing audio chunks in parallel "
+                    "(spread round-robin across GPUs, or splitting CPU threads)",
+        ge=1,
+        le=16
+    )
 
 
 class ProcessingConfig(BaseSettings):
@@ -141,6 +222,22 @@ class ProcessingConfig(BaseSettings):
         le=600
     )
     
+    # Wall-clock bound on a whole chunked run, retries included
+    processing_deadline: int = Field(
+        default=1800,
+        description="Deadline in seconds for processing all chunks of one transcript",
+        ge=60,
+        le=7200
+    )
+    
+    @validator('processing_deadline', pre=True)
+    def validate_processing_deadline(cls, v):
+        """Support backward compatibility for PER_JOB_DEADLINE"""
+        if v != 1800:  # If not default
+            return v
+        legacy_value = os.getenv('PER_JOB_DEADLINE')
+        return int(legacy_value) if legacy_value else v
+    
     # Chunking configuration for large transcripts
     chunking_threshold: int = Field(
         default=20000,
@@ -163,6 +260,14 @@ class ProcessingConfig(BaseSettings):
         le=2000
     )
     
+    # Token-aware chunking (used instead of character chunking when tiktoken is installed)
+    chunk_tokens: int = Field(
+        default=12000,
+        description="Tokens per chunk; kept below the per-call output cap since output mirrors input length",
+        ge=1000,
+        le=100000
+    )
+    
     # Concurrency configuration
     max_concurrent_chunks: int = Field(
         default=3,
@@ -195,6 +300,14 @@ class ProcessingConfig(BaseSettings):
         legacy_value = os.getenv('CHUNK_OVERLAP')
         return int(legacy_value) if legacy_value else v
     
+    @validator('chunk_tokens', pre=True)
+    def validate_chunk_tokens(cls, v):
+        """Support backward compatibility for CHUNK_TOKENS"""
+        if v != 12000:  # If not default
+            return v
+        legacy_value = os.getenv('CHUNK_TOKENS')
+        return int(legacy_value) if legacy_value else v
+    
     @validator('max_concurrent_chunks', pre=True)
     def validate_max_concurrent_chunks(cls, v):
         """Support backward compatibility for MAX_CONCURRENT_CHUNKS"""
@@ -203,6 +316,97 @@ class ProcessingConfig(BaseSettings):
         legacy_value = os.getenv('MAX_CONCURRENT_CHUNKS')
         return int(legacy_value) if legacy_value else v
     
+    stream_responses: bool = Field(
+        default=False,
+        description="Stream single-pass output to the processed file as it is generated"
+    )
+    
+    # On-disk response cache, keyed by a hash of the full request; opt-in because
+    # it is meant for prompt tuning and nothing evicts its files
+    response_cache: bool = Field(
+        default=False,
+        description="Reuse cached AI responses for identical requests"
+    )
+    
+    cache_dir: str = Field(
+        default="~/.cache/yt_summarizer",
+        description="Directory for cached AI responses"
+    )
+    
+    @validator('cache_dir', pre=True)
+    def validate_cache_dir(cls, v):
+        """Support backward compatibility for YT_CACHE_DIR"""
+        if v != "~/.cache/yt_summarizer":  # If not default
+            return v
+        legacy_value = os.getenv('YT_CACHE_DIR')
+        return legacy_value if legacy_value else v
+    
+    # OpenAI Batch API configuration (chunked transcripts only)
+    use_batch_api: bool = Field(
+        default=False,
+        description="Submit chunked transcripts through the OpenAI Batch API"
+    )
+    
+    batch_poll_interval: int = Field(
+        default=10,
+        description="Initial Batch API status poll interval in seconds",
+        ge=1,
+        le=300
+    )
+    
+    @validator('use_batch_api', pre=True)
+    def validate_use_batch_api(cls, v):
+        """Support backward compatibility for USE_BATCH_API"""
+        if v is not False:  # If not default
+            return v
+        legacy_value = os.getenv('USE_BATCH_API')
+        return legacy_value.lower() in ('1', 'true', 'yes') if legacy_value else v
+    
+    # Client-side rate limiting, matched to the account's OpenAI limits (unset = no limit)
+    openai_rpm: Optional[int] = Field(
+        default=None,
+        description="OpenAI requests per minute",
+        ge=1
+    )
+    
+    openai_tpm: Optional[int] = Field(
+        default=None,
+        description="OpenAI tokens per minute",
+        ge=1000
+    )
+    
+    @validator('openai_rpm', pre=True)
+    def validate_openai_rpm(cls, v):
+        """Support backward compatibility for OPENAI_RPM"""
+        if v is not None:
+            return v
+        legacy_value = os.getenv('OPENAI_RPM')
+        return int(legacy_value) if legacy_value else None
+    
+    @validator('openai_tpm', pre=True)
+    def validate_openai_tpm(cls, v):
+        """Support backward compatibility for OPENAI_TPM"""
+        if v is not None:
+            return v
+        legacy_value = os.getenv('OPENAI_TPM')
+        return int(legacy_value) if legacy_value else None
+    
+    # Per-request output cap; each request asks for an input-sized budget up to this
+    max_output_tokens: int = Field(
+        default=16384,
+        description="Maximum output tokens per OpenAI request",
+        ge=1024,
+        le=16384
+    )
+    
+    @validator('max_output_tokens', pre=True)
+    def validate_max_output_tokens(cls, v):
+        """Support backward compatibility for MAX_OUTPUT_TOKENS"""
+        if v != 16384:  # If not default
+            return v
+        legacy_value = os.getenv('MAX_OUTPUT_TOKENS')
+        return int(legacy_value) if legacy_value else v
+    
     max_retries: int = Field(
         default=3,
         description="Maximum API retry attempts",
@@ -243,6 +447,27 @@ class AppConfig(BaseSettings):
         default=None,
         description="Temporary directory for processing files"
     )
+    
+    # Job summary output
+    job_summary_format: str = Field(
+        default="csv",
+        description="Job summary sink format (csv or parquet)"
+    )
+    
+    @validator('job_summary_format')
+    def validate_job_summary_format(cls, v):
+        valid_formats = ["csv", "parquet"]
+        if v not in valid_formats:
+            raise ValueError(f"Job summary format must be one of {valid_formats}")
+        return v
+    
+    # Batch configuration
+    max_concurrent_jobs: int = Field(
+        default=4,
+        description="Maximum videos processed concurrently in a batch run",
+        ge=1,
+        le=16
+    )
 
 
 # Global configuration instance
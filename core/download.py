@@ -6,9 +6,10 @@ Uses tenacity for robust retry logic and pydantic for validation.
 """
 
 import os
-import time
-from typing import Optional, Dict, Any
-from urllib.parse import urlparse, parse_qs
+import re
+import functools
+import threading
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 import yt_dlp
@@ -34,6 +35,9 @@ except ImportError:
 # Configure structured logger
 logger = structlog.get_logger(__name__)
 
+# Manually exported browser cookies for bypassing YouTube bot protection
+COOKIES_FILE = 'youtube_cookies.txt'
+
 
 class VideoInfo(BaseModel):
     """Validated video information model"""
@@ -91,25 +95,76 @@ class YouTubeError(DownloadError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def cookies_available() -> bool:
+    """Check once per process whether the manual cookies file exists"""
+    available = os.path.exists(COOKIES_FILE)
+    logger.debug("Cookies file probed", filepath=COOKIES_FILE, available=available)
+    return available
+
+
+def ydl_options(**overrides) -> Dict[str, Any]:
+    """Base yt-dlp options shared by every invocation, with manual cookies when present"""
+    
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        **overrides
+    }
+    
+    if cookies_available():
+        ydl_opts['cookiesfrombrowser'] = None
+        ydl_opts['cookiefile'] = COOKIES_FILE
+    
+    return ydl_opts
+
+
+@functools.lru_cache(maxsize=32)
+def extract_info_cached(url: str) -> Dict[str, Any]:
+    """Run yt-dlp's extractor once per URL
+    
+    Metadata and caption lookup both need the same info dict, and each
+    extraction is a full round trip to YouTube. Failures are not cached, so
+    retries extract again. Callers must treat the result as read-only.
+    """
+    with yt_dlp.YoutubeDL(ydl_options()) as ydl:
+        return ydl.extract_info(url, download=False)
+
+
+# httplib2 connections are not thread-safe, so each worker thread keeps its own client
+_youtube_clients = threading.local()
+
+
+def get_youtube_service(api_key: str):
+    """Return this thread's YouTube Data API client, building it on first use
+    
+    build() constructs the whole service class from the discovery document;
+    the copy bundled with google-api-python-client avoids fetching it.
+    """
+    if getattr(_youtube_clients, 'api_key', None) != api_key:
+        _youtube_clients.service = build('youtube', 'v3', developerKey=api_key,
+                                         cache_discovery=False, static_discovery=True)
+        _youtube_clients.api_key = api_key
+    return _youtube_clients.service
+
+
+# Watch, embed and /v/ URLs on youtube.com, and youtu.be short links
+VIDEO_URL_PATTERN = re.compile(
+    r'https?://(?:(?:www\.)?youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|v/)'
+    r'|(?:www\.)?youtu\.be/)'
+    r'([\w-]{11})(?![\w-])',
+    re.IGNORECASE  # hostnames are case-insensitive
+)
+
+
 def extract_video_id(url: str) -> Optional[str]:
     """Extract YouTube video ID from various URL formats"""
-    try:
-        parsed_url = urlparse(url)
-        
-        if parsed_url.hostname in ['www.youtube.com', 'youtube.com']:
-            if parsed_url.path == '/watch':
-                return parse_qs(parsed_url.query).get('v', [None])[0]
-            elif parsed_url.path.startswith('/embed/'):
-                return parsed_url.path.split('/')[2]
-            elif parsed_url.path.startswith('/v/'):
-                return parsed_url.path.split('/')[2]
-        elif parsed_url.hostname in ['youtu.be', 'www.youtu.be']:
-            return parsed_url.path[1:]
-        
-        return None
-    except Exception as e:
-        logger.error("Failed to extract video ID", url=url, error=str(e))
-        return None
+    match = VIDEO_URL_PATTERN.match(url)
+    return match.group(1) if match else None
+
+
+# ISO 8601 duration as returned by the YouTube Data API, e.g. PT1H4M13S
+ISO_DURATION_PATTERN = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
 
 
 def parse_duration(duration_iso: str) -> str:
@@ -117,35 +172,17 @@ def parse_duration(duration_iso: str) -> str:
     if not duration_iso:
         return 'Unknown'
     
-    try:
-        # Remove 'PT' prefix
-        if duration_iso.startswith('PT'):
-            duration_iso = duration_iso[2:]
-        
-        hours = 0
-        minutes = 0
-        seconds = 0
-        
-        # Parse hours, minutes, seconds
-        if 'H' in duration_iso:
-            hours = int(duration_iso.split('H')[0])
-            duration_iso = duration_iso.split('H')[1]
-        
-        if 'M' in duration_iso:
-            minutes = int(duration_iso.split('M')[0])
-            duration_iso = duration_iso.split('M')[1]
-        
-        if 'S' in duration_iso:
-            seconds = int(duration_iso.split('S')[0])
-        
-        # Format readable duration
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            return f"{minutes}:{seconds:02d}"
-    
-    except Exception:
+    match = ISO_DURATION_PATTERN.fullmatch(duration_iso)
+    if not match:
         return 'Unknown'
+    
+    hours, minutes, seconds = (int(value) if value else 0 for value in match.groups())
+    
+    # Format readable duration
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    else:
+        return f"{minutes}:{seconds:02d}"
 
 
 def parse_datetime(datetime_iso: str) -> str:
@@ -160,6 +197,34 @@ def parse_datetime(datetime_iso: str) -> str:
         return 'Unknown'
 
 
+def truncate_text(text: Optional[str], limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    text = text or ''
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+@functools.lru_cache(maxsize=256)
+def get_channel_info(api_key: str, channel_id: str) -> Dict[str, Any]:
+    """Fetch channel statistics once per channel
+    
+    The lookup needs the channel ID from the video response, so it cannot be
+    batched with it; caching saves the second round trip whenever a batch
+    holds several videos from one channel.
+    """
+    channel_response = get_youtube_service(api_key).channels().list(
+        part='statistics',
+        id=channel_id
+    ).execute()
+    
+    if not channel_response['items']:
+        return {}
+    
+    channel_stats = channel_response['items'][0].get('statistics', {})
+    return {
+        'subscriber_count': channel_stats.get('subscriberCount', 'Hidden'),
+    }
+
+
 @retry(
     stop=stop_after_attempt(config.download.max_retries),
     wait=wait_exponential(
@@ -185,7 +250,7 @@ def get_enhanced_video_info(url: str) -> Optional[VideoInfo]:
         try:
             logger.debug("Attempting YouTube Data API v3", video_id=video_id)
             
-            youtube = build('youtube', 'v3', developerKey=config.download.youtube_api_key)
+            youtube = get_youtube_service(config.download.youtube_api_key)
             
             # Get video details
             video_response = youtube.videos().list(
@@ -201,20 +266,7 @@ def get_enhanced_video_info(url: str) -> Optional[VideoInfo]:
                 status = video.get('status', {})
                 
                 # Get channel details
-                channel_response = youtube.channels().list(
-                    part='snippet,statistics',
-                    id=snippet['channelId']
-                ).execute()
-                
-                channel_info = {}
-                if channel_response['items']:
-                    channel = channel_response['items'][0]
-                    channel_snippet = channel['snippet']
-                    channel_stats = channel.get('statistics', {})
-                    
-                    channel_info = {
-                        'subscriber_count': channel_stats.get('subscriberCount', 'Hidden'),
-                    }
+                channel_info = get_channel_info(config.download.youtube_api_key, snippet['channelId'])
                 
                 # Parse duration and publish date
                 duration = content_details.get('duration', '')
@@ -229,9 +281,7 @@ def get_enhanced_video_info(url: str) -> Optional[VideoInfo]:
                     'uploader': snippet.get('channelTitle', 'Unknown'),
                     'url': url,
                     'channel_id': snippet.get('channelId', ''),
-                    'description': (snippet.get('description', '')[:500] + '...' 
-                                  if len(snippet.get('description', '')) > 500 
-                                  else snippet.get('description', '')),
+                    'description': truncate_text(snippet.get('description'), 500),
                     'published_at': published_readable,
                     'duration': duration_readable,
                     'view_count': statistics.get('viewCount', '0'),
@@ -279,46 +329,109 @@ def get_video_info_fallback(url: str) -> Optional[VideoInfo]:
     
     logger.debug("Using yt-dlp fallback for metadata", video_id=video_id)
     
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-    }
-    
-    # Check for manual cookies
-    if os.path.exists('youtube_cookies.txt'):
-        ydl_opts['cookiesfrombrowser'] = None
-        ydl_opts['cookiefile'] = 'youtube_cookies.txt'
-        logger.debug("Using manual cookies for metadata")
-    
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            video_info_data = {
-                'video_id': video_id,
-                'title': info.get('title', 'Unknown'),
-                'uploader': info.get('uploader', 'Unknown'),
-                'url': url,
-                'description': (info.get('description', '')[:500] + '...' 
-                               if len(info.get('description', '')) > 500 
-                               else info.get('description', '')),
-                'duration': (str(info.get('duration', 'Unknown')) + ' seconds' 
-                            if info.get('duration') else 'Unknown'),
-                'view_count': str(info.get('view_count', '0')) if info.get('view_count') else '0',
-                'like_count': str(info.get('like_count', '0')) if info.get('like_count') else '0',
-                'api_source': 'yt_dlp'
-            }
-            
-            logger.info("Successfully fetched basic metadata", 
-                       video_id=video_id, api_source="yt_dlp")
-            
-            return VideoInfo(**video_info_data)
-            
+        info = extract_info_cached(url)
+        
+        video_info_data = {
+            'video_id': video_id,
+            'title': info.get('title', 'Unknown'),
+            'uploader': info.get('uploader', 'Unknown'),
+            'url': url,
+            'description': truncate_text(info.get('description'), 500),
+            'duration': (str(info.get('duration', 'Unknown')) + ' seconds' 
+                        if info.get('duration') else 'Unknown'),
+            'view_count': str(info.get('view_count', '0')) if info.get('view_count') else '0',
+            'like_count': str(info.get('like_count', '0')) if info.get('like_count') else '0',
+            'api_source': 'yt_dlp'
+        }
+        
+        logger.info("Successfully fetched basic metadata", 
+                   video_id=video_id, api_source="yt_dlp")
+        
+        return VideoInfo(**video_info_data)
+        
     except Exception as e:
         logger.error("Failed to fetch video metadata", video_id=video_id, error=str(e))
         raise NetworkError(f"Could not fetch video metadata: {e}")
 
 
+def find_vtt_track(tracks: Dict[str, Any], languages: List[str]) -> Optional[Dict[str, Any]]:
+    """Return the first WebVTT track among the given language codes, in order"""
+    for lang in languages:
+        for track in tracks.get(lang, []):
+            if track.get('ext') == 'vtt' and track.get('url'):
+                return track
+    return None
+
+
+def select_caption_track(info: Dict[str, Any], language: str) -> Optional[Dict[str, Any]]:
+    """Pick a WebVTT caption track in the given language, preferring manual subtitles
+    
+    Automatic captions are only taken in the video's original language:
+    YouTube offers machine translations of its speech recognition under every
+    other language code, while the original is also listed as '<lang>-orig'.
+    """
+    
+    def matches(lang: str) -> bool:
+        return lang == language or lang.startswith(f"{language}-")
+    
+    subtitles = info.get('subtitles') or {}
+    track = find_vtt_track(subtitles, [language] + sorted(lang for lang in subtitles
+                                                          if lang != language and matches(lang)))
+    if track is not None:
+        return track
+    
+    automatic = info.get('automatic_captions') or {}
+    candidates = [f"{language}-orig"]
+    if matches(info.get('language') or ''):
+        candidates += [language] + sorted(lang for lang in automatic
+                                          if lang not in candidates and lang != language and matches(lang))
+    return find_vtt_track(automatic, candidates)
+
+
+def fetch_captions(video_info: VideoInfo) -> Optional[str]:
+    """Fetch the video's YouTube captions as WebVTT text, or None when there are none"""
+    
+    # A known spoken language wins over the caption preference
+    language = config.transcription.language or config.transcription.caption_language
+    logger.debug("Looking for YouTube captions", video_id=video_info.video_id, language=language)
+    
+    try:
+        info = extract_info_cached(video_info.url)
+        track = select_caption_track(info, language)
+        if track is None:
+            logger.info("No captions available", video_id=video_info.video_id, language=language)
+            return None
+        
+        with yt_dlp.YoutubeDL(ydl_options()) as ydl:
+            vtt = ydl.urlopen(track['url']).read().decode('utf-8')
+    except Exception as e:
+        # Captions are only a shortcut; the audio path still works
+        logger.warning("Failed to fetch captions", video_id=video_info.video_id, error=str(e))
+        return None
+    
+    logger.info("Fetched YouTube captions", video_id=video_info.video_id, size_bytes=len(vtt))
+    return vtt
+
+
+def find_downloaded_audio(output_stem: str) -> Tuple[int, Optional[str]]:
+    """Find the largest finished download named output_stem with a single directory read
+    
+    Only the stem itself or the stem plus an extension match, so chunk files
+    ({stem}_chunk_NNN.webm) left over from an interrupted run are never picked.
+    """
+    with os.scandir('.') as entries:
+        candidates = [
+            (entry.stat().st_size, entry.name)
+            for entry in entries
+            if (entry.name == output_stem or entry.name.startswith(output_stem + "."))
+            and not entry.name.endswith(('.part', '.ytdl'))
+            and entry.is_file()
+        ]
+    
+    return max(candidates, default=(0, None))
+
+
 @retry(
     stop=stop_after_attempt(config.download.max_retries),
     wait=wait_exponential(
@@ -338,20 +451,12 @@ def download_audio(video_info: VideoInfo) -> AudioFile:
     
     output_path = f"{video_info.video_id}_audio"
     
-    ydl_opts = {
-        'format': 'bestaudio/best',
-        'outtmpl': output_path,
-        'quiet': True,
-        'no_warnings': True,
-        'socket_timeout': config.download.timeout,
-        'http_timeout': config.download.timeout,
-    }
-    
-    # Check for manual cookies first
-    if os.path.exists('youtube_cookies.txt'):
-        ydl_opts['cookiesfrombrowser'] = None
-        ydl_opts['cookiefile'] = 'youtube_cookies.txt'
-        logger.debug("Using manually exported cookies for download")
+    ydl_opts = ydl_options(
+        format=config.download.audio_format,
+        outtmpl=output_path,
+        socket_timeout=config.download.timeout,
+        http_timeout=config.download.timeout,
+    )
     
     download_complete = False
     
@@ -372,7 +477,7 @@ def download_audio(video_info: VideoInfo) -> AudioFile:
             logger.error("YouTube bot protection detected", video_id=video_info.video_id)
             raise YouTubeError(
                 "YouTube bot protection detected. "
-                "Please export cookies from browser and save as 'youtube_cookies.txt'"
+                f"Please export cookies from browser and save as '{COOKIES_FILE}'"
             )
         else:
             logger.error("Download failed", video_id=video_info.video_id, error=error_msg)
@@ -382,29 +487,19 @@ def download_audio(video_info: VideoInfo) -> AudioFile:
     if not download_complete:
         logger.warning("Download may not have completed properly", video_id=video_info.video_id)
     
-    # Find and verify the downloaded audio file
-    audio_file = None
-    for ext in ['', '.mp4', '.webm', '.m4a', '.opus']:
-        test_file = f"{output_path}{ext}"
-        if os.path.exists(test_file):
-            file_size = os.path.getsize(test_file)
-            if file_size > 1000:  # At least 1KB
-                audio_file = test_file
-                logger.info("Audio download verified", 
-                           video_id=video_info.video_id,
-                           filepath=audio_file,
-                           size_mb=file_size/1024/1024)
-                break
-    
-    if not audio_file:
+    # yt-dlp renames the finished file into place before download() returns
+    file_size, audio_file = find_downloaded_audio(output_path)
+    if not audio_file or file_size <= 1000:  # At least 1KB
         raise DownloadError("Downloaded audio file not found or is empty")
     
-    # Small delay to ensure file is fully written
-    time.sleep(1)
+    logger.info("Audio download verified", 
+               video_id=video_info.video_id,
+               filepath=audio_file,
+               size_mb=file_size/1024/1024)
     
     # Return validated AudioFile model
     return AudioFile(
         filepath=audio_file,
-        size_bytes=os.path.getsize(audio_file),
+        size_bytes=file_size,
         video_info=video_info
     )
\ No newline at end of file
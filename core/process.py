@@ -7,7 +7,14 @@ Uses structured logging, pydantic validation, and async processing with tenacity
 
 import os
 import re
+import io
+import json
+import hashlib
+import time
 import asyncio
+import bisect
+import functools
+import threading
 from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 from datetime import datetime
@@ -17,18 +24,45 @@ from pydantic import BaseModel, Field, validator
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type
 )
+import httpx
+import openai
 from openai import OpenAI, AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
+# HTTP/2 needs the optional h2 package; fall back to pooled HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Token-aware chunking needs the optional tiktoken package; fall back to character chunking
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 from config import config
 from core.transcribe import Transcript, VideoInfo
 
 # Configure structured logger
 logger = structlog.get_logger(__name__)
 
+# Resolved once at import; the prompt lives at the repository root
+SYSTEM_PROMPT_PATH = Path(__file__).resolve().parent.parent / "system_prompt.md"
+
+# Natural text boundaries used when splitting transcripts into chunks
+_PARAGRAPH_BREAK = '\n\n'
+_PARAGRAPH_BREAK_RE = re.compile(r'(?=\n\n)')  # lookahead keeps overlapping runs
+_SENTENCE_END_RE = re.compile(r'[.!?] ')
+
+# Markdown header lines (with any blank lines between them) opening a chunk
+_LEADING_HEADERS_RE = re.compile(r'\A#[^\n]*\n(?:(?:#[^\n]*)?\n)*')
+
 
 class ProcessingStrategy(BaseModel):
     """Strategy for processing transcript"""
@@ -39,7 +73,7 @@ class ProcessingStrategy(BaseModel):
     
     @validator('method')
     def validate_method(cls, v):
-        valid_methods = ["single_pass", "chunked_concurrent"]
+        valid_methods = ["single_pass", "chunked_concurrent", "chunked_batch"]
         if v not in valid_methods:
             raise ValueError(f"Method must be one of {valid_methods}")
         return v
@@ -68,6 +102,7 @@ class ProcessedChunk(BaseModel):
     original_chunk: TextChunk = Field(description="Original chunk metadata")
     token_usage: Dict[str, int] = Field(description="Token usage statistics")
     processing_time: float = Field(description="Processing time in seconds")
+    cached: bool = Field(default=False, description="Served from the response cache")
     
     @validator('processed_text')
     def validate_processed_text(cls, v):
@@ -84,17 +119,32 @@ class ProcessedTranscript(BaseModel):
     processing_strategy: ProcessingStrategy = Field(description="Processing strategy used")
     chunks: Optional[List[ProcessedChunk]] = Field(None, description="Individual processed chunks")
     total_tokens: Dict[str, int] = Field(description="Total token usage")
+    cached_calls: int = Field(default=0, description="API calls served from the response cache", ge=0)
     processing_time: float = Field(description="Total processing time in seconds")
     char_reduction_ratio: float = Field(description="Character reduction ratio")
+    char_count: int = Field(default=0, description="Processed character count", ge=0)
+    word_count: int = Field(default=0, description="Processed word count", ge=0)
     
     @validator('char_reduction_ratio', always=True)
     def calculate_reduction_ratio(cls, v, values):
         if 'processed_text' in values and 'original_transcript' in values:
-            original_len = len(values['original_transcript'].text)
+            original_len = values['original_transcript'].char_count
             processed_len = len(values['processed_text'])
             if original_len > 0:
                 return processed_len / original_len
         return 1.0
+    
+    @validator('char_count', always=True)
+    def set_char_count(cls, v, values):
+        if 'processed_text' in values:
+            return len(values['processed_text'])
+        return v or 0
+    
+    @validator('word_count', always=True)
+    def set_word_count(cls, v, values):
+        if 'processed_text' in values:
+            return len(values['processed_text'].split())
+        return v or 0
 
 
 class ProcessingError(Exception):
@@ -103,8 +153,10 @@ class ProcessingError(Exception):
 
 
 class APIError(ProcessingError):
-    """OpenAI API related errors"""
-    pass
+    """OpenAI API related errors (transient, retried)"""
+    
+    # Seconds the server asked us to wait before retrying, if it said so
+    retry_after: Optional[float] = None
 
 
 class ChunkingError(ProcessingError):
@@ -112,102 +164,499 @@ class ChunkingError(ProcessingError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
 def load_system_prompt() -> str:
-    """Load the system prompt from system_prompt.md"""
+    """Load the system prompt from system_prompt.md (read once per process)"""
     
     logger.info("Loading system prompt")
-    prompt_file = Path(__file__).parent.parent / "system_prompt.md"
-    
-    if not prompt_file.exists():
-        logger.error("System prompt file not found", filepath=str(prompt_file))
-        raise ProcessingError(f"System prompt file not found: {prompt_file}")
     
     try:
-        with open(prompt_file, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-        
-        if len(content) < 50:
-            raise ProcessingError("System prompt too short")
-        
-        logger.info("System prompt loaded successfully", 
-                   char_count=len(content))
-        return content
-        
+        content = SYSTEM_PROMPT_PATH.read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        logger.error("System prompt file not found", filepath=str(SYSTEM_PROMPT_PATH))
+        raise ProcessingError(f"System prompt file not found: {SYSTEM_PROMPT_PATH}")
     except Exception as e:
         logger.error("Failed to load system prompt", error=str(e))
         raise ProcessingError(f"Failed to load system prompt: {e}")
+    
+    if len(content) < 50:
+        raise ProcessingError("System prompt too short")
+    
+    logger.info("System prompt loaded successfully", 
+               char_count=len(content))
+    return content
+
+
+# Transient OpenAI failures worth retrying: 429s, timeouts, dropped connections, 5xx
+_TRANSIENT_API_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """Read the Retry-After delay from an OpenAI error response, if present"""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    
+    headers = response.headers
+    try:
+        if headers.get('retry-after-ms'):
+            return float(headers['retry-after-ms']) / 1000
+        if headers.get('retry-after'):
+            return float(headers['retry-after'])
+    except ValueError:
+        pass
+    return None
+
+
+def is_quota_error(error: Exception) -> bool:
+    """Whether a 429 means the account is out of credit rather than throttled"""
+    if getattr(error, 'code', None) == "insufficient_quota":
+        return True
+    body = getattr(error, 'body', None)
+    if isinstance(body, dict):
+        details = body.get('error', body)
+        return isinstance(details, dict) and details.get('code') == "insufficient_quota"
+    return False
+
+
+def classify_api_error(error: Exception, context: str = "") -> ProcessingError:
+    """Wrap an exception as a retryable APIError or a terminal ProcessingError"""
+    
+    # Retrying an exhausted quota only burns the backoff budget before failing anyway
+    if is_quota_error(error):
+        return ProcessingError(f"OpenAI quota exhausted{context}: {error}")
+    
+    if isinstance(error, (APIError,) + _TRANSIENT_API_ERRORS):
+        api_error = APIError(f"API error{context}: {error}")
+        api_error.retry_after = retry_after_seconds(error)
+        return api_error
+    
+    return ProcessingError(f"Processing error{context}: {error}")
+
+
+_jittered_backoff = wait_random_exponential(multiplier=config.processing.retry_delay, max=60)
+
+
+def wait_api_retry(retry_state) -> float:
+    """Honor the server's Retry-After when given, else full-jitter exponential backoff"""
+    error = retry_state.outcome.exception()
+    retry_after = getattr(error, 'retry_after', None)
+    if retry_after:
+        return min(retry_after, 60)
+    return _jittered_backoff(retry_state)
+
+
+# Shared retry policy for every chat completion call
+retry_api_call = retry(
+    stop=stop_after_attempt(config.processing.max_retries),
+    wait=wait_api_retry,
+    retry=retry_if_exception_type((APIError,)),
+    reraise=True
+)
+
+
+def output_token_limit(messages: List[Dict[str, str]]) -> int:
+    """max_tokens for a request, sized to its input since output mirrors the input length"""
+    content = messages[-1]["content"]
+    if token_counting_available():
+        # Headroom for the headers and list markup the prompt adds
+        estimate = count_tokens(content) * 3 // 2
+    else:
+        # A character count bounds the token count for all but the densest scripts
+        estimate = len(content)
+    return min(config.processing.max_output_tokens, max(1024, estimate))
+
+
+def response_cache_path(messages: List[Dict[str, str]]) -> Optional[Path]:
+    """Content-addressed cache file for a request, or None when caching is off"""
+    if not config.processing.response_cache:
+        return None
+    
+    request = json.dumps({
+        "model": config.processing.openai_model,
+        "messages": messages,
+        "temperature": 0.3,
+        "max_tokens": output_token_limit(messages)
+    }, sort_keys=True, ensure_ascii=False)
+    key = hashlib.sha256(request.encode('utf-8')).hexdigest()
+    return Path(config.processing.cache_dir).expanduser() / f"{key}.txt"
+
+
+def read_cached_response(messages: List[Dict[str, str]]) -> Optional[str]:
+    """Return the cached response for an identical earlier request, if any"""
+    cache_path = response_cache_path(messages)
+    if cache_path is None:
+        return None
+    
+    try:
+        content = cache_path.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Failed to read cached response", filepath=str(cache_path), error=str(e))
+        return None
+    
+    logger.info("Using cached AI response", filepath=str(cache_path))
+    return content
+
+
+def write_cached_response(messages: List[Dict[str, str]], content: str,
+                          finish_reason: Optional[str]):
+    """Store a complete response; a failed cache write never fails the job"""
+    cache_path = response_cache_path(messages)
+    if cache_path is None:
+        return
+    
+    # A response cut off at max_tokens would otherwise be replayed on every run
+    if finish_reason != "stop":
+        logger.info("Not caching incomplete AI response", finish_reason=finish_reason)
+        return
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(content, encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.warning("Failed to cache AI response", filepath=str(cache_path), error=str(e))
+
+
+# Placeholder usage for cache hits; the job summary marks them instead of reporting it
+_CACHED_TOKEN_USAGE = {'input_tokens': 0, 'output_tokens': 0, 'total_tokens': 0}
+
+
+class RateLimiter:
+    """Thread-safe token bucket refilled continuously at a per-minute rate"""
+    
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, amount: float) -> float:
+        """Take amount from the bucket and return how long to wait before using it
+        
+        The bucket may go negative: later callers queue behind the debt, so
+        waiters are served in arrival order across threads and event loops.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+            self.updated = now
+            self.available -= min(amount, self.capacity)
+            return max(0.0, -self.available / self.rate)
+
+
+# Process-wide so concurrent chunks and concurrent jobs share the account limits
+_request_limiter = RateLimiter(config.processing.openai_rpm) if config.processing.openai_rpm else None
+_token_limiter = RateLimiter(config.processing.openai_tpm) if config.processing.openai_tpm else None
+
+
+def estimate_request_tokens(messages: List[Dict[str, str]]) -> int:
+    """Estimate a request's rate-limit cost the way OpenAI does: chars / 4 plus max_tokens"""
+    prompt_chars = sum(len(message["content"]) for message in messages)
+    return prompt_chars // 4 + output_token_limit(messages)
+
+
+def rate_limit_delay(messages: List[Dict[str, str]]) -> float:
+    """Reserve RPM and TPM capacity for one request, returning the wait in seconds"""
+    delay = 0.0
+    if _request_limiter is not None:
+        delay = max(delay, _request_limiter.reserve(1))
+    if _token_limiter is not None:
+        delay = max(delay, _token_limiter.reserve(estimate_request_tokens(messages)))
+    if delay > 0:
+        logger.debug("Throttling request for rate limits", delay=round(delay, 2))
+    return delay
+
+
+def throttle_request(messages: List[Dict[str, str]]):
+    """Block until the request fits within the configured rate limits"""
+    delay = rate_limit_delay(messages)
+    if delay > 0:
+        time.sleep(delay)
+
+
+async def throttle_request_async(messages: List[Dict[str, str]]):
+    """Wait, without blocking the event loop, until the request fits the rate limits"""
+    delay = rate_limit_delay(messages)
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+_client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
+
+
+def get_openai_client() -> OpenAI:
+    """Return the process-wide sync OpenAI client, creating it on first use"""
+    global _client
+    
+    api_key = config.processing.openai_api_key
+    if not api_key:
+        raise ProcessingError("OpenAI API key not configured")
+    
+    with _client_lock:
+        if _client is None:
+            # Retries are handled by retry_api_call; SDK retries would multiply them
+            _client = OpenAI(
+                api_key=api_key,
+                timeout=config.processing.api_timeout,
+                max_retries=0
+            )
+            logger.debug("OpenAI client created")
+        return _client
+
+
+def create_async_openai_client() -> AsyncOpenAI:
+    """Create the async client shared by every chunk request of one event loop"""
+    
+    api_key = config.processing.openai_api_key
+    if not api_key:
+        raise ProcessingError("OpenAI API key not configured")
+    
+    # One pooled connection (multiplexed over HTTP/2 when h2 is installed)
+    # serves every chunk instead of a TLS handshake per concurrent request
+    max_concurrent = config.processing.max_concurrent_chunks
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(config.processing.api_timeout),
+        limits=httpx.Limits(
+            max_connections=max_concurrent,
+            max_keepalive_connections=max_concurrent
+        )
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0)
+
+
+def load_token_encoder(model: str):
+    """Load the tiktoken encoding for a model; the first load downloads its BPE file"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Models newer than the installed tiktoken use the current default encoding
+        return tiktoken.get_encoding("o200k_base")
+
+
+@functools.lru_cache(maxsize=None)
+def get_token_encoder(model: str):
+    """Return the tiktoken encoding for a model, or None when it cannot be loaded
+    
+    The result is cached for the life of the process, failures included, so an
+    offline host logs the fallback once instead of retrying the download per call.
+    """
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return load_token_encoder(model)
+    except Exception as e:
+        logger.warning("Could not load tiktoken encoding, falling back to character-based chunking",
+                       model=model,
+                       error=str(e))
+        return None
+
+
+def token_counting_available() -> bool:
+    """Whether transcripts are measured in tokens rather than characters"""
+    return get_token_encoder(config.processing.openai_model) is not None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in text using the configured model's encoding"""
+    encoder = get_token_encoder(config.processing.openai_model)
+    return len(encoder.encode_ordinary(text))
 
 
 def determine_processing_strategy(transcript: Transcript) -> ProcessingStrategy:
     """Determine the best processing strategy based on transcript length"""
     
     char_count = len(transcript.text)
-    threshold = config.processing.chunking_threshold
     
-    logger.info("Determining processing strategy",
-               char_count=char_count,
-               threshold=threshold)
+    if token_counting_available():
+        # Real token counts: chunk only when the transcript exceeds one chunk's budget
+        token_count = count_tokens(transcript.text)
+        chunk_tokens = config.processing.chunk_tokens
+        
+        logger.info("Determining processing strategy",
+                   char_count=char_count,
+                   token_count=token_count,
+                   chunk_tokens=chunk_tokens)
+        
+        requires_chunking = token_count > chunk_tokens
+        estimated_chunks = max(1, -(-token_count // chunk_tokens))
+    else:
+        threshold = config.processing.chunking_threshold
+        
+        logger.info("Determining processing strategy",
+                   char_count=char_count,
+                   threshold=threshold)
+        
+        # Calculate number of chunks needed
+        chunk_size = config.processing.chunk_size
+        overlap = config.processing.chunk_overlap
+        requires_chunking = char_count > threshold
+        estimated_chunks = max(1, (char_count - overlap) // (chunk_size - overlap))
     
-    if char_count <= threshold:
+    if not requires_chunking:
         strategy = ProcessingStrategy(
             method="single_pass",
             requires_chunking=False
         )
         logger.info("Selected single-pass processing strategy")
     else:
-        # Calculate number of chunks needed
-        chunk_size = config.processing.chunk_size
-        overlap = config.processing.chunk_overlap
-        estimated_chunks = max(1, (char_count - overlap) // (chunk_size - overlap))
+        method = "chunked_batch" if config.processing.use_batch_api else "chunked_concurrent"
         
         strategy = ProcessingStrategy(
-            method="chunked_concurrent",
+            method=method,
             requires_chunking=True,
             chunk_count=estimated_chunks
         )
-        logger.info("Selected chunked concurrent processing strategy",
+        logger.info("Selected chunked processing strategy",
+                   method=method,
                    estimated_chunks=estimated_chunks)
     
     return strategy
 
 
-def find_split_point(text: str, target_pos: int, max_search: int = 500) -> int:
+class TextBoundaries(BaseModel):
+    """Precomputed natural split offsets (match start positions) for a text"""
+    
+    paragraph_breaks: List[int] = Field(description="Offsets of each '\\n\\n'")
+    sentence_ends: List[int] = Field(description="Offsets of each sentence terminator + space")
+
+
+def find_text_boundaries(text: str) -> TextBoundaries:
+    """Scan the text once for every paragraph break and sentence end"""
+    return TextBoundaries(
+        paragraph_breaks=[m.start() for m in _PARAGRAPH_BREAK_RE.finditer(text)],
+        sentence_ends=[m.start() for m in _SENTENCE_END_RE.finditer(text)]
+    )
+
+
+def _nearest_offset(offsets: List[int], target_pos: int,
+                    window_start: int, window_end: int) -> Optional[int]:
+    """Bisect for the boundary nearest to target_pos inside the search window"""
+    
+    idx = bisect.bisect_left(offsets, target_pos)
+    back = offsets[idx - 1] if idx > 0 and offsets[idx - 1] >= window_start else None
+    fwd = offsets[idx] if idx < len(offsets) and offsets[idx] + 2 <= window_end else None
+    
+    if back is not None and (fwd is None or target_pos - back <= fwd - target_pos):
+        return back
+    return fwd
+
+
+def find_split_point(text: str, target_pos: int, max_search: int = 500,
+                     boundaries: Optional[TextBoundaries] = None) -> int:
     """Find optimal split point near target position, preferring natural boundaries"""
     
-    # Look for paragraph break (double newline) first
-    for offset in range(0, max_search, 50):
-        # Search backwards
-        pos = target_pos - offset
-        if pos > 0 and pos < len(text) - 1 and text[pos:pos+2] == '\n\n':
-            return pos + 2
-        
-        # Search forwards
-        pos = target_pos + offset
-        if pos < len(text) - 2 and text[pos:pos+2] == '\n\n':
-            return pos + 2
+    window_start = max(0, target_pos - max_search)
+    window_end = min(len(text), target_pos + max_search)
+    
+    # Bisect precomputed offsets when splitting the same text repeatedly
+    if boundaries is not None:
+        for offsets in (boundaries.paragraph_breaks, boundaries.sentence_ends):
+            offset = _nearest_offset(offsets, target_pos, window_start, window_end)
+            if offset is not None:
+                return offset + 2
+        return target_pos
+    
+    # Look for paragraph break (double newline) first, nearest to the target wins
+    back = text.rfind(_PARAGRAPH_BREAK, window_start, target_pos + 1)
+    fwd = text.find(_PARAGRAPH_BREAK, target_pos, window_end)
+    if back != -1 and (fwd == -1 or target_pos - back <= fwd - target_pos):
+        return back + 2
+    if fwd != -1:
+        return fwd + 2
     
     # If no paragraph break, look for sentence end
-    for offset in range(0, max_search, 10):
-        # Search backwards
-        pos = target_pos - offset
-        if pos > 0 and pos < len(text) and text[pos] in '.!?' and pos + 1 < len(text) and text[pos + 1] == ' ':
-            return pos + 2
-        
-        # Search forwards  
-        pos = target_pos + offset
-        if (pos < len(text) - 1 and 
-            text[pos] in '.!?' and 
-            pos + 1 < len(text) and 
-            text[pos + 1] == ' '):
-            return pos + 2
+    back_match = None
+    for back_match in _SENTENCE_END_RE.finditer(text, window_start, target_pos + 1):
+        pass
+    fwd_match = _SENTENCE_END_RE.search(text, target_pos, window_end)
+    if back_match and (not fwd_match or target_pos - back_match.start() <= fwd_match.start() - target_pos):
+        return back_match.end()
+    if fwd_match:
+        return fwd_match.end()
     
     # Fallback to target position
     return target_pos
 
 
+def chunk_transcript_tokens(text: str) -> List[TextChunk]:
+    """Greedily pack sentence and paragraph segments into chunks within the token budget"""
+    
+    max_tokens = config.processing.chunk_tokens
+    encoder = get_token_encoder(config.processing.openai_model)
+    
+    logger.info("Starting token-aware chunking",
+               text_length=len(text),
+               chunk_tokens=max_tokens)
+    
+    # Segment at every natural boundary and count all segments in one batch
+    boundaries = find_text_boundaries(text)
+    cuts = sorted(
+        {offset + 2 for offset in boundaries.paragraph_breaks + boundaries.sentence_ends
+         if offset + 2 < len(text)} | {len(text)}
+    )
+    spans = list(zip([0] + cuts[:-1], cuts))
+    token_counts = [len(ids) for ids in encoder.encode_ordinary_batch([text[a:b] for a, b in spans])]
+    
+    segments = []
+    for (seg_start, seg_end), n_tokens in zip(spans, token_counts):
+        if n_tokens <= max_tokens:
+            segments.append((seg_start, n_tokens))
+            continue
+        
+        # No natural boundary within budget: cut on token boundaries instead
+        ids = encoder.encode_ordinary(text[seg_start:seg_end])
+        _, offsets = encoder.decode_with_offsets(ids)
+        for i in range(0, len(ids), max_tokens):
+            segments.append((seg_start + offsets[i], min(max_tokens, len(ids) - i)))
+    
+    chunks = []
+    chunk_start = 0
+    pending_tokens = 0
+    
+    for seg_start, n_tokens in segments:
+        if pending_tokens and pending_tokens + n_tokens > max_tokens:
+            chunk_text = text[chunk_start:seg_start]
+            chunks.append(TextChunk(
+                text=chunk_text,
+                chunk_index=len(chunks),
+                char_count=len(chunk_text)
+            ))
+            chunk_start = seg_start
+            pending_tokens = 0
+        pending_tokens += n_tokens
+    
+    chunk_text = text[chunk_start:]
+    chunks.append(TextChunk(
+        text=chunk_text,
+        chunk_index=len(chunks),
+        char_count=len(chunk_text)
+    ))
+    
+    logger.info("Token-aware chunking completed",
+               total_chunks=len(chunks),
+               total_tokens=sum(token_counts))
+    
+    return chunks
+
+
 def chunk_transcript_text(text: str) -> List[TextChunk]:
     """Split transcript text into overlapping chunks at natural boundaries"""
     
+    if token_counting_available():
+        return chunk_transcript_tokens(text)
+    
     chunk_size = config.processing.chunk_size
     overlap = config.processing.chunk_overlap
     
@@ -225,6 +674,9 @@ def chunk_transcript_text(text: str) -> List[TextChunk]:
         logger.info("Text fits in single chunk", char_count=len(text))
         return [chunk]
     
+    # One scan for all boundaries, then a bisect per split instead of a rescan
+    boundaries = find_text_boundaries(text)
+    
     chunks = []
     start = 0
     
@@ -234,7 +686,7 @@ def chunk_transcript_text(text: str) -> List[TextChunk]:
         
         # If not the last chunk, find a good split point
         if end < len(text):
-            end = find_split_point(text, end, max_search=500)
+            end = find_split_point(text, end, max_search=500, boundaries=boundaries)
         
         # Extract chunk
         chunk_text = text[start:end]
@@ -248,7 +700,9 @@ def chunk_transcript_text(text: str) -> List[TextChunk]:
             
             # Try to split the oversized chunk
             mid_point = len(chunk_text) // 2
-            split_point = find_split_point(chunk_text, mid_point, max_search=1000)
+            split_point = find_split_point(
+                text, start + mid_point, max_search=1000, boundaries=boundaries
+            ) - start
             
             if split_point > 100 and split_point < len(chunk_text) - 100:
                 # Successfully split the chunk
@@ -306,16 +760,26 @@ def chunk_transcript_text(text: str) -> List[TextChunk]:
     return chunks
 
 
-@retry(
-    stop=stop_after_attempt(config.processing.max_retries),
-    wait=wait_exponential(
-        multiplier=config.processing.retry_delay,
-        min=1,
-        max=60
-    ),
-    retry=retry_if_exception_type((APIError,)),
-    reraise=True
-)
+def build_chunk_messages(chunk: TextChunk, system_prompt: str, total_chunks: int) -> List[Dict[str, str]]:
+    """Build the chat messages for one chunk of a (possibly multi-chunk) transcript"""
+    
+    # The system prompt must stay byte-identical across every request so
+    # OpenAI's automatic prompt caching can reuse it; per-chunk context goes
+    # at the start of the user message, after the cacheable prefix
+    user_content = chunk.text
+    if total_chunks > 1:
+        user_content = (
+            f"[Part {chunk.chunk_index + 1} of {total_chunks} of a larger transcript. "
+            f"Maintain consistency and continuity.]\n\n{chunk.text}"
+        )
+    
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_content}
+    ]
+
+
+@retry_api_call
 async def process_chunk_async(
     client: AsyncOpenAI,
     chunk: TextChunk,
@@ -331,25 +795,27 @@ async def process_chunk_async(
                 total_chunks=total_chunks,
                 char_count=chunk.char_count)
     
+    messages = build_chunk_messages(chunk, system_prompt, total_chunks)
+    
+    cached_text = read_cached_response(messages)
+    if cached_text is not None:
+        return ProcessedChunk(
+            processed_text=cached_text,
+            original_chunk=chunk,
+            token_usage=dict(_CACHED_TOKEN_USAGE),
+            processing_time=0.0,
+            cached=True
+        )
+    
+    await throttle_request_async(messages)
+    
     try:
-        # Add chunk context to system prompt for multi-chunk processing
-        enhanced_prompt = system_prompt
-        if total_chunks > 1:
-            enhanced_prompt = (
-                f"{system_prompt}\n\n"
-                f"Note: This is part {chunk.chunk_index + 1} of {total_chunks} "
-                f"of a larger transcript. Maintain consistency and continuity."
-            )
-        
         # Make the API call
         response: ChatCompletion = await client.chat.completions.create(
             model=config.processing.openai_model,
-            messages=[
-                {"role": "system", "content": enhanced_prompt},
-                {"role": "user", "content": chunk.text}
-            ],
+            messages=messages,
             temperature=0.3,
-            max_tokens=16384,
+            max_tokens=output_token_limit(messages),
             timeout=config.processing.api_timeout
         )
         
@@ -374,6 +840,8 @@ async def process_chunk_async(
             processing_time=processing_time
         )
         
+        write_cached_response(messages, processed_text, response.choices[0].finish_reason)
+        
         logger.info("Chunk processed successfully",
                    chunk_index=chunk.chunk_index,
                    processing_time=processing_time,
@@ -386,10 +854,7 @@ async def process_chunk_async(
         logger.error("Chunk processing failed",
                     chunk_index=chunk.chunk_index,
                     error=str(e))
-        if "timeout" in str(e).lower() or "rate limit" in str(e).lower():
-            raise APIError(f"API error for chunk {chunk.chunk_index}: {e}")
-        else:
-            raise ProcessingError(f"Processing error for chunk {chunk.chunk_index}: {e}")
+        raise classify_api_error(e, f" for chunk {chunk.chunk_index}")
 
 
 async def process_chunks_concurrently(
@@ -398,38 +863,61 @@ async def process_chunks_concurrently(
 ) -> List[ProcessedChunk]:
     """Process multiple chunks concurrently with semaphore limiting"""
     
-    # Initialize async OpenAI client
-    api_key = config.processing.openai_api_key
-    if not api_key:
-        raise ProcessingError("OpenAI API key not configured")
-    
-    async_client = AsyncOpenAI(api_key=api_key)
-    
     logger.info("Starting concurrent chunk processing",
                total_chunks=len(chunks),
-               max_concurrent=config.processing.max_concurrent_chunks)
+               max_concurrent=config.processing.max_concurrent_chunks,
+               http2=HTTP2_AVAILABLE)
     
     # Create semaphore to limit concurrent requests
     semaphore = asyncio.Semaphore(config.processing.max_concurrent_chunks)
     
-    async def process_with_semaphore(chunk: TextChunk) -> ProcessedChunk:
-        async with semaphore:
-            return await process_chunk_async(
-                async_client, chunk, system_prompt, len(chunks)
-            )
+    # The client's connection pool is closed when the block exits, even on error
+    async with create_async_openai_client() as async_client:
+        async def process_with_semaphore(chunk: TextChunk) -> ProcessedChunk:
+            async with semaphore:
+                return await process_chunk_async(
+                    async_client, chunk, system_prompt, len(chunks)
+                )
+        
+        # Create tasks for all chunks
+        tasks = [process_with_semaphore(chunk) for chunk in chunks]
+        
+        # Process all chunks concurrently; collect failures instead of letting the
+        # first one abandon the sibling requests that are still in flight.
+        # gather keeps results in chunk order regardless of completion order.
+        results = await asyncio.gather(*tasks, return_exceptions=True)
     
-    # Create tasks for all chunks
-    tasks = [process_with_semaphore(chunk) for chunk in chunks]
+    failures = [
+        (chunk.chunk_index, result)
+        for chunk, result in zip(chunks, results)
+        if isinstance(result, BaseException)
+    ]
+    if failures:
+        for chunk_index, error in failures:
+            logger.error("Chunk failed during concurrent processing",
+                        chunk_index=chunk_index,
+                        error=str(error))
+        failed_indexes = [chunk_index for chunk_index, _ in failures]
+        raise ProcessingError(
+            f"Concurrent processing failed for {len(failures)} of {len(chunks)} chunks "
+            f"{failed_indexes}: {failures[0][1]}"
+        )
     
-    # Process all chunks concurrently
-    try:
-        processed_chunks = await asyncio.gather(*tasks)
-        logger.info("Concurrent processing completed successfully",
-                   processed_chunks=len(processed_chunks))
-        return processed_chunks
-    except Exception as e:
-        logger.error("Concurrent processing failed", error=str(e))
-        raise ProcessingError(f"Concurrent processing failed: {e}")
+    logger.info("Concurrent processing completed successfully",
+               processed_chunks=len(results))
+    return list(results)
+
+
+def strip_leading_headers(text: str) -> str:
+    """Drop the markdown header (and blank) lines a chunk repeats before its content"""
+    
+    match = _LEADING_HEADERS_RE.match(text)
+    if match:
+        remainder = text[match.end():]
+        # Keep the chunk intact if it is nothing but headers
+        if remainder and not remainder.startswith('#'):
+            return remainder
+    return text
 
 
 def merge_processed_chunks(processed_chunks: List[ProcessedChunk]) -> str:
@@ -440,26 +928,15 @@ def merge_processed_chunks(processed_chunks: List[ProcessedChunk]) -> str:
     
     logger.info("Merging processed chunks", chunk_count=len(processed_chunks))
     
-    merged = processed_chunks[0].processed_text
+    # Collect parts and join once rather than re-copying the growing result
+    parts = [processed_chunks[0].processed_text]
     
-    for i in range(1, len(processed_chunks)):
-        current_text = processed_chunks[i].processed_text
-        
+    for processed_chunk in processed_chunks[1:]:
         # Remove duplicate headers if they appear at the start of subsequent chunks
-        if current_text.startswith('#'):
-            lines = current_text.split('\n')
-            content_start = 0
-            for j, line in enumerate(lines):
-                if line and not line.startswith('#'):
-                    content_start = j
-                    break
-            
-            # Skip duplicate headers if found
-            if content_start > 0:
-                current_text = '\n'.join(lines[content_start:])
-        
-        # Merge with double newline separation
-        merged += '\n\n' + current_text
+        parts.append(strip_leading_headers(processed_chunk.processed_text))
+    
+    # Merge with double newline separation
+    merged = '\n\n'.join(parts)
     
     logger.info("Chunk merging completed",
                final_length=len(merged),
@@ -468,45 +945,102 @@ def merge_processed_chunks(processed_chunks: List[ProcessedChunk]) -> str:
     return merged
 
 
-def process_single_pass(transcript: Transcript, system_prompt: str) -> ProcessedTranscript:
-    """Process transcript in a single API call"""
+def stream_completion(client: OpenAI, messages: List[Dict[str, str]],
+                      stream_path: Path) -> Tuple[str, Dict[str, int], Optional[str]]:
+    """Stream a chat completion, appending deltas to stream_path as they arrive"""
+    
+    stream = client.chat.completions.create(
+        model=config.processing.openai_model,
+        messages=messages,
+        temperature=0.3,
+        max_tokens=output_token_limit(messages),
+        stream=True,
+        stream_options={"include_usage": True}
+    )
+    
+    parts = []
+    usage = None
+    finish_reason = None
+    
+    with open(stream_path, 'w', encoding='utf-8') as f:
+        for event in stream:
+            # The final event carries usage and no choices
+            if event.usage:
+                usage = event.usage
+            if event.choices:
+                finish_reason = event.choices[0].finish_reason or finish_reason
+                delta = event.choices[0].delta.content
+                if delta:
+                    f.write(delta)
+                    parts.append(delta)
+    
+    logger.debug("Streamed completion written",
+                filepath=str(stream_path),
+                deltas=len(parts))
+    
+    token_usage = {
+        'input_tokens': usage.prompt_tokens if usage else 0,
+        'output_tokens': usage.completion_tokens if usage else 0,
+        'total_tokens': usage.total_tokens if usage else 0
+    }
+    return ''.join(parts), token_usage, finish_reason
+
+
+@retry_api_call
+def process_single_pass(transcript: Transcript, system_prompt: str,
+                        stream_path: Optional[Path] = None) -> ProcessedTranscript:
+    """Process transcript in a single API call, optionally streaming output to disk"""
     
     logger.info("Starting single-pass processing",
-               char_count=len(transcript.text))
+               char_count=len(transcript.text),
+               streaming=stream_path is not None)
     
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.monotonic()
     
-    # Initialize OpenAI client
-    api_key = config.processing.openai_api_key
-    if not api_key:
-        raise ProcessingError("OpenAI API key not configured")
+    client = get_openai_client()
     
-    client = OpenAI(api_key=api_key, timeout=config.processing.api_timeout)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": transcript.text}
+    ]
     
     try:
-        response: ChatCompletion = client.chat.completions.create(
-            model=config.processing.openai_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": transcript.text}
-            ],
-            temperature=0.3,
-            max_tokens=16384
-        )
+        finish_reason = None
+        cached_text = read_cached_response(messages)
+        if cached_text is not None:
+            processed_text, total_tokens = cached_text, dict(_CACHED_TOKEN_USAGE)
+        elif stream_path is not None:
+            throttle_request(messages)
+            processed_text, total_tokens, finish_reason = stream_completion(
+                client, messages, stream_path
+            )
+        else:
+            throttle_request(messages)
+            response: ChatCompletion = client.chat.completions.create(
+                model=config.processing.openai_model,
+                messages=messages,
+                temperature=0.3,
+                max_tokens=output_token_limit(messages)
+            )
+            
+            processed_text = response.choices[0].message.content
+            finish_reason = response.choices[0].finish_reason
+            
+            # Extract token usage
+            usage = response.usage
+            total_tokens = {
+                'input_tokens': usage.prompt_tokens,
+                'output_tokens': usage.completion_tokens,
+                'total_tokens': usage.total_tokens
+            }
         
-        processed_text = response.choices[0].message.content
         if not processed_text:
             raise APIError("API returned empty response")
         
-        processing_time = asyncio.get_event_loop().time() - start_time
+        if cached_text is None:
+            write_cached_response(messages, processed_text, finish_reason)
         
-        # Extract token usage
-        usage = response.usage
-        total_tokens = {
-            'input_tokens': usage.prompt_tokens,
-            'output_tokens': usage.completion_tokens,
-            'total_tokens': usage.total_tokens
-        }
+        processing_time = time.monotonic() - start_time
         
         strategy = ProcessingStrategy(
             method="single_pass",
@@ -518,6 +1052,7 @@ def process_single_pass(transcript: Transcript, system_prompt: str) -> Processed
             original_transcript=transcript,
             processing_strategy=strategy,
             total_tokens=total_tokens,
+            cached_calls=1 if cached_text is not None else 0,
             processing_time=processing_time,
             char_reduction_ratio=len(processed_text) / len(transcript.text)
         )
@@ -528,13 +1063,10 @@ def process_single_pass(transcript: Transcript, system_prompt: str) -> Processed
                    total_tokens=total_tokens['total_tokens'])
         
         return result
-        
+    
     except Exception as e:
         logger.error("Single-pass processing failed", error=str(e))
-        if "timeout" in str(e).lower() or "rate limit" in str(e).lower():
-            raise APIError(f"API error: {e}")
-        else:
-            raise ProcessingError(f"Processing failed: {e}")
+        raise classify_api_error(e)
 
 
 def process_chunked_concurrent(transcript: Transcript, system_prompt: str) -> ProcessedTranscript:
@@ -543,7 +1075,7 @@ def process_chunked_concurrent(transcript: Transcript, system_prompt: str) -> Pr
     logger.info("Starting chunked concurrent processing",
                char_count=len(transcript.text))
     
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.monotonic()
     
     # Split transcript into chunks
     chunks = chunk_transcript_text(transcript.text)
@@ -552,22 +1084,21 @@ def process_chunked_concurrent(transcript: Transcript, system_prompt: str) -> Pr
         raise ChunkingError("Failed to create text chunks")
     
     try:
-        # Create new event loop for async processing
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
+        # Process chunks concurrently on a loop scoped to this call; the
+        # deadline cancels stragglers so a stalled request cannot hang the job
+        deadline = config.processing.processing_deadline
         try:
-            # Process chunks concurrently
-            processed_chunks = loop.run_until_complete(
-                process_chunks_concurrently(chunks, system_prompt)
-            )
-        finally:
-            loop.close()
+            processed_chunks = asyncio.run(asyncio.wait_for(
+                process_chunks_concurrently(chunks, system_prompt),
+                timeout=deadline
+            ))
+        except asyncio.TimeoutError:
+            raise ProcessingError(f"Chunks not processed within the {deadline}s deadline")
         
         # Merge processed chunks
         merged_text = merge_processed_chunks(processed_chunks)
         
-        processing_time = asyncio.get_event_loop().time() - start_time
+        processing_time = time.monotonic() - start_time
         
         # Calculate total token usage
         total_tokens = {
@@ -588,6 +1119,7 @@ def process_chunked_concurrent(transcript: Transcript, system_prompt: str) -> Pr
             processing_strategy=strategy,
             chunks=processed_chunks,
             total_tokens=total_tokens,
+            cached_calls=sum(1 for chunk in processed_chunks if chunk.cached),
             processing_time=processing_time,
             char_reduction_ratio=len(merged_text) / len(transcript.text)
         )
@@ -605,8 +1137,170 @@ def process_chunked_concurrent(transcript: Transcript, system_prompt: str) -> Pr
         raise ProcessingError(f"Chunked processing failed: {e}")
 
 
-def process_transcript(transcript: Transcript) -> ProcessedTranscript:
-    """Main processing function - handles both single-pass and chunked strategies"""
+def wait_for_batch(client: OpenAI, batch_id: str):
+    """Poll a Batch API job with exponential backoff until it reaches a terminal state"""
+    
+    delay = config.processing.batch_poll_interval
+    
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        
+        logger.info("Batch status polled",
+                   batch_id=batch_id,
+                   status=batch.status,
+                   completed=batch.request_counts.completed if batch.request_counts else None,
+                   total=batch.request_counts.total if batch.request_counts else None)
+        
+        if batch.status == "completed":
+            return batch
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise APIError(f"Batch {batch_id} ended with status '{batch.status}'")
+        
+        time.sleep(delay)
+        delay = min(delay * 2, 300)
+
+
+def process_chunked_batch(transcript: Transcript, system_prompt: str) -> ProcessedTranscript:
+    """Process transcript chunks through the OpenAI Batch API (half price, 24h window)"""
+    
+    logger.info("Starting chunked batch processing",
+               char_count=len(transcript.text))
+    
+    start_time = time.monotonic()
+    
+    # Split transcript into chunks
+    chunks = chunk_transcript_text(transcript.text)
+    
+    if not chunks:
+        raise ChunkingError("Failed to create text chunks")
+    
+    client = get_openai_client()
+    
+    try:
+        # One chat completion request per chunk, matched back up by custom_id
+        requests = io.BytesIO()
+        for chunk in chunks:
+            messages = build_chunk_messages(chunk, system_prompt, len(chunks))
+            request = {
+                "custom_id": f"chunk-{chunk.chunk_index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": config.processing.openai_model,
+                    "messages": messages,
+                    "temperature": 0.3,
+                    "max_tokens": output_token_limit(messages)
+                }
+            }
+            requests.write(json.dumps(request).encode('utf-8') + b"\n")
+        
+        input_file = client.files.create(
+            file=("transcript_chunks.jsonl", requests.getvalue()),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        logger.info("Batch submitted",
+                   batch_id=batch.id,
+                   chunk_count=len(chunks))
+        
+        batch = wait_for_batch(client, batch.id)
+        
+        if not batch.output_file_id:
+            raise APIError(f"Batch {batch.id} completed without an output file")
+        
+        output = client.files.content(batch.output_file_id).text
+        
+        processing_time = time.monotonic() - start_time
+        
+        # Results come back in arbitrary order; index them by chunk
+        chunks_by_index = {chunk.chunk_index: chunk for chunk in chunks}
+        processed_by_index: Dict[int, ProcessedChunk] = {}
+        
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            
+            record = json.loads(line)
+            chunk_index = int(record["custom_id"].split("-", 1)[1])
+            response = record.get("response") or {}
+            
+            if record.get("error") or response.get("status_code") != 200:
+                raise APIError(
+                    f"Batch request failed for chunk {chunk_index}: "
+                    f"{record.get('error') or response.get('body')}"
+                )
+            
+            body = response["body"]
+            usage = body.get("usage", {})
+            
+            processed_by_index[chunk_index] = ProcessedChunk(
+                processed_text=body["choices"][0]["message"]["content"] or "",
+                original_chunk=chunks_by_index[chunk_index],
+                token_usage={
+                    'input_tokens': usage.get('prompt_tokens', 0),
+                    'output_tokens': usage.get('completion_tokens', 0),
+                    'total_tokens': usage.get('total_tokens', 0)
+                },
+                processing_time=processing_time
+            )
+        
+        missing = sorted(set(chunks_by_index) - set(processed_by_index))
+        if missing:
+            raise APIError(f"Batch {batch.id} returned no result for chunks {missing}")
+        
+        processed_chunks = [processed_by_index[index] for index in sorted(processed_by_index)]
+        
+        # Merge processed chunks
+        merged_text = merge_processed_chunks(processed_chunks)
+        
+        # Calculate total token usage
+        total_tokens = {
+            'input_tokens': sum(chunk.token_usage['input_tokens'] for chunk in processed_chunks),
+            'output_tokens': sum(chunk.token_usage['output_tokens'] for chunk in processed_chunks),
+            'total_tokens': sum(chunk.token_usage['total_tokens'] for chunk in processed_chunks)
+        }
+        
+        strategy = ProcessingStrategy(
+            method="chunked_batch",
+            requires_chunking=True,
+            chunk_count=len(chunks)
+        )
+        
+        result = ProcessedTranscript(
+            processed_text=merged_text,
+            original_transcript=transcript,
+            processing_strategy=strategy,
+            chunks=processed_chunks,
+            total_tokens=total_tokens,
+            processing_time=processing_time,
+            char_reduction_ratio=len(merged_text) / len(transcript.text)
+        )
+        
+        logger.info("Chunked batch processing completed",
+                   batch_id=batch.id,
+                   chunk_count=len(chunks),
+                   processing_time=processing_time,
+                   char_reduction=f"{result.char_reduction_ratio:.2%}",
+                   total_tokens=total_tokens['total_tokens'])
+        
+        return result
+        
+    except Exception as e:
+        logger.error("Chunked batch processing failed", error=str(e))
+        raise ProcessingError(f"Batch processing failed: {e}")
+
+
+def process_transcript(transcript: Transcript, stream_path: Optional[Path] = None) -> ProcessedTranscript:
+    """Main processing function - handles both single-pass and chunked strategies
+    
+    When stream_path is given, single-pass output is written there as it is
+    generated; chunked strategies ignore it.
+    """
     
     logger.info("Starting transcript processing",
                video_id=transcript.video_info.video_id,
@@ -624,9 +1318,11 @@ def process_transcript(transcript: Transcript) -> ProcessedTranscript:
     
     # Execute appropriate processing strategy
     if strategy.method == "single_pass":
-        result = process_single_pass(transcript, system_prompt)
+        result = process_single_pass(transcript, system_prompt, stream_path)
     elif strategy.method == "chunked_concurrent":
         result = process_chunked_concurrent(transcript, system_prompt)
+    elif strategy.method == "chunked_batch":
+        result = process_chunked_batch(transcript, system_prompt)
     else:
         raise ProcessingError(f"Unknown processing method: {strategy.method}")
     
@@ -6,17 +6,42 @@ Uses pydantic for validation and follows lessons from CLAUDE.md (no artificial t
 """
 
 import os
-import math
+import re
+import html
+import functools
 import subprocess
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
-import whisper
 import structlog
 from pydantic import BaseModel, Field, validator
 
+# Try to import faster-whisper (CTranslate2 backend), fall back to openai-whisper
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Try to import pywhispercpp (whisper.cpp SIMD kernels) for CPU-only machines
+try:
+    from pywhispercpp.model import Model as WhisperCppModel
+    WHISPER_CPP_AVAILABLE = True
+except ImportError:
+    WHISPER_CPP_AVAILABLE = False
+
+# Try to import mutagen to read durations from container headers in-process
+try:
+    from mutagen import File as MutagenFile
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
 from config import config
-from core.download import AudioFile, VideoInfo
+from core.download import AudioFile, VideoInfo, fetch_captions
 
 # Add current directory to PATH for local ffmpeg (ensure it's at the beginning)
 current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -65,6 +90,7 @@ class TranscriptSegment(BaseModel):
     text: str = Field(description="Transcribed text content")
     chunk_index: int = Field(description="Source chunk index", ge=0)
     char_count: int = Field(default=0, description="Character count", ge=0)
+    language: Optional[str] = Field(None, description="Spoken language Whisper detected or was given")
     
     @validator('char_count', always=True)
     def set_char_count(cls, v, values):
@@ -82,6 +108,7 @@ class Transcript(BaseModel):
     video_info: VideoInfo = Field(description="Associated video information")
     processing_method: str = Field(description="Processing method used")
     chunk_count: Optional[int] = Field(None, description="Number of chunks processed")
+    word_count: int = Field(default=0, description="Total word count", ge=0)
     
     @validator('char_count', always=True)
     def set_char_count(cls, v, values):
@@ -89,6 +116,12 @@ class Transcript(BaseModel):
             return len(values['text'])
         return v or 0
     
+    @validator('word_count', always=True)
+    def set_word_count(cls, v, values):
+        if 'text' in values:
+            return len(values['text'].split())
+        return v or 0
+    
     @validator('text')
     def validate_transcript_length(cls, v):
         if len(v) < 10:
@@ -112,9 +145,34 @@ class WhisperError(TranscriptionError):
 
 
 def get_audio_duration(audio_file: str) -> Optional[float]:
-    """Get duration of audio file in seconds using ffmpeg"""
+    """Get duration of audio file in seconds, probing each file version once"""
+    try:
+        stat = os.stat(audio_file)
+    except OSError as e:
+        logger.warning("Could not get audio duration", file=audio_file, error=str(e))
+        return None
+    return probe_audio_duration(audio_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def probe_audio_duration(audio_file: str, mtime_ns: int, size: int) -> Optional[float]:
+    """Get duration of audio file in seconds from its container header
+    
+    mtime_ns and size only key the cache, so a rewritten file is probed again.
+    """
+    if MUTAGEN_AVAILABLE:
+        try:
+            # Reads the WebM/Ogg/MP4 header in-process, no subprocess spawn
+            media = MutagenFile(audio_file)
+            if media is not None and media.info.length:
+                duration = float(media.info.length)
+                logger.debug("Audio duration detected via mutagen", 
+                            file=audio_file, duration_minutes=duration/60)
+                return duration
+        except Exception as e:
+            logger.debug("mutagen failed, trying ffprobe", error=str(e))
+    
     try:
-        # Try ffprobe first (more reliable)
         cmd = [
             'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
             '-of', 'csv=p=0', audio_file
@@ -125,29 +183,6 @@ def get_audio_duration(audio_file: str) -> Optional[float]:
             logger.debug("Audio duration detected via ffprobe", 
                         file=audio_file, duration_minutes=duration/60)
             return duration
-    except Exception as e:
-        logger.debug("ffprobe failed, trying ffmpeg", error=str(e))
-    
-    try:
-        # Fallback to ffmpeg if ffprobe not available
-        cmd = ['ffmpeg', '-i', audio_file, '-f', 'null', '-']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        
-        # Parse duration from stderr output (ffmpeg puts info in stderr)
-        output = result.stderr if result.stderr else ""
-        for line in output.split('\n'):
-            if 'Duration:' in line:
-                duration_str = line.split('Duration:')[1].split(',')[0].strip()
-                # Parse HH:MM:SS.ss format
-                parts = duration_str.split(':')
-                if len(parts) == 3:
-                    hours = float(parts[0])
-                    minutes = float(parts[1])
-                    seconds = float(parts[2])
-                    total_seconds = hours * 3600 + minutes * 60 + seconds
-                    logger.debug("Audio duration detected via ffmpeg", 
-                                file=audio_file, duration_minutes=total_seconds/60)
-                    return total_seconds
     except Exception as e:
         logger.warning("Could not get audio duration", file=audio_file, error=str(e))
     
@@ -191,144 +226,434 @@ def should_chunk_audio(audio_file: AudioFile, chunk_config: ChunkConfig) -> bool
     return False
 
 
-def chunk_audio_file(audio_file: AudioFile, chunk_config: ChunkConfig) -> List[AudioChunk]:
-    """Split audio file into smaller chunks using ffmpeg"""
+def iter_audio_chunks(audio_file: AudioFile, chunk_config: ChunkConfig) -> Iterator[AudioChunk]:
+    """Split audio file into smaller chunks with one ffmpeg pass, then yield each valid chunk
+    
+    The split runs to completion before the first chunk is yielded, so the
+    first transcription waits for the whole ffmpeg pass.
+    """
     
     logger.info("Starting audio chunking",
                filepath=audio_file.filepath,
                chunk_duration_seconds=chunk_config.duration_seconds)
     
     base_name = Path(audio_file.filepath).stem
-    chunks = []
+    chunk_glob = f"{base_name}_chunk_*.webm"
+    
+    # Leftovers from an earlier run would be picked up as chunks of this one
+    for stale_file in Path('.').glob(chunk_glob):
+        stale_file.unlink()
+    
+    # The segment muxer reads the input once and stream-copies it into
+    # numbered files, instead of one ffmpeg run (and one demux from the start
+    # of the file) per chunk
+    cmd = [
+        'ffmpeg', '-i', audio_file.filepath,
+        '-f', 'segment',
+        '-segment_time', str(chunk_config.duration_seconds),
+        '-segment_start_number', '1',
+        '-reset_timestamps', '1',
+        '-c', 'copy', '-y', f"{base_name}_chunk_%03d.webm"
+    ]
+    
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+    except subprocess.TimeoutExpired:
+        raise AudioProcessingError("Timeout splitting audio into chunks")
     
-    # Get total duration
-    total_duration = get_audio_duration(audio_file.filepath)
-    if not total_duration:
-        logger.warning("Could not determine audio duration, using default chunking")
-        total_duration = 3600  # Default to 1 hour max
+    if result.returncode != 0:
+        logger.error("Failed to split audio", returncode=result.returncode, stderr=result.stderr)
+        raise AudioProcessingError(f"ffmpeg failed to split audio (exit code {result.returncode})")
     
-    num_chunks = math.ceil(total_duration / chunk_config.duration_seconds)
-    logger.info("Splitting audio into chunks",
-               total_chunks=num_chunks,
+    chunk_files = sorted(Path('.').glob(chunk_glob))
+    logger.info("Audio split into chunks",
+               total_chunks=len(chunk_files),
                duration_per_chunk_minutes=chunk_config.duration_seconds//60)
     
-    for i in range(num_chunks):
-        start_time = i * chunk_config.duration_seconds
-        chunk_file = f"{base_name}_chunk_{i+1:03d}.webm"
-        
-        # Build ffmpeg command
-        cmd = [
-            'ffmpeg', '-i', audio_file.filepath, 
-            '-ss', str(start_time), 
-            '-t', str(chunk_config.duration_seconds), 
-            '-c', 'copy', '-y', chunk_file
-        ]
+    created = 0
+    for i, chunk_path in enumerate(chunk_files):
+        chunk_size = chunk_path.stat().st_size
+        if chunk_size <= 1000:  # At least 1KB
+            # Remove tiny chunks (likely at the end)
+            chunk_path.unlink()
+            logger.debug("Chunk too small, skipping", chunk=i+1)
+            continue
         
-        try:
-            logger.debug("Creating audio chunk",
-                        chunk=i+1, total=num_chunks, 
-                        start_time_minutes=start_time//60)
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-            
-            if result.returncode == 0 and os.path.exists(chunk_file):
-                chunk_size = os.path.getsize(chunk_file)
-                if chunk_size > 1000:  # At least 1KB
-                    chunk = AudioChunk(
-                        filepath=chunk_file,
-                        chunk_index=i,
-                        size_bytes=chunk_size
-                    )
-                    chunks.append(chunk)
-                    logger.debug("Chunk created successfully",
-                                chunk=i+1, size_kb=chunk_size/1024)
-                else:
-                    # Remove tiny chunks (likely at the end)
-                    os.remove(chunk_file)
-                    logger.debug("Chunk too small, skipping", chunk=i+1)
-            else:
-                logger.error("Failed to create chunk", 
-                           chunk=i+1, returncode=result.returncode,
-                           stderr=result.stderr)
-                
-        except subprocess.TimeoutExpired:
-            logger.error("Timeout creating chunk", chunk=i+1)
-        except Exception as e:
-            logger.error("Error creating chunk", chunk=i+1, error=str(e))
+        created += 1
+        logger.debug("Chunk created successfully",
+                    chunk=i+1, size_kb=chunk_size/1024)
+        yield AudioChunk(
+            filepath=str(chunk_path),
+            chunk_index=i,
+            size_bytes=chunk_size
+        )
     
-    if not chunks:
+    if not created:
         raise AudioProcessingError("Failed to create any valid audio chunks")
     
-    logger.info("Audio chunking completed", total_valid_chunks=len(chunks))
-    return chunks
+    logger.info("Audio chunking completed", total_valid_chunks=created)
+
+
+def chunk_audio_file(audio_file: AudioFile, chunk_config: ChunkConfig) -> List[AudioChunk]:
+    """Split audio file into smaller chunks using ffmpeg"""
+    return list(iter_audio_chunks(audio_file, chunk_config))
+
+
+def cuda_available() -> bool:
+    """Whether torch sees a CUDA device; torch is imported only when asked"""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+
+def resolve_backend() -> str:
+    """Resolve the configured transcription backend against what is installed"""
+    backend = config.transcription.backend
+    if backend == "auto":
+        if FASTER_WHISPER_AVAILABLE:
+            return "faster-whisper"
+        # whisper.cpp's AVX2/NEON kernels beat PyTorch on CPU, not on a GPU
+        if WHISPER_CPP_AVAILABLE and not cuda_available():
+            return "whisper-cpp"
+        return "openai-whisper"
+    if backend == "faster-whisper" and not FASTER_WHISPER_AVAILABLE:
+        raise WhisperError("faster-whisper backend requested but faster-whisper is not installed")
+    if backend == "whisper-cpp" and not WHISPER_CPP_AVAILABLE:
+        raise WhisperError("whisper-cpp backend requested but pywhispercpp is not installed")
+    return backend
+
+
+# Sizes with an English-only .en checkpoint on every backend
+ENGLISH_ONLY_MODELS = {"tiny", "base", "small", "medium"}
+
+
+def resolve_whisper_model() -> str:
+    """Resolve the configured Whisper model name, choosing one when set to auto"""
+    whisper_model = config.transcription.whisper_model
+    if whisper_model == "auto":
+        # The distilled checkpoints are English-only, so other or undetected
+        # languages keep the multilingual base model
+        if resolve_backend() == "faster-whisper" and config.transcription.language == "en":
+            # Distilled 2-layer decoder: large-v3 accuracy at several times the decode
+            # speed, but only shipped as CTranslate2 weights and too slow on CPU
+            if ctranslate2.get_cuda_device_count() > 0:
+                return "distil-large-v3"
+            # Around base's CPU cost at close to small.en accuracy
+            return "distil-small.en"
+        whisper_model = "base"
+    
+    # English-only checkpoints are more accurate at the same size
+    if config.transcription.language == "en" and whisper_model in ENGLISH_ONLY_MODELS:
+        return f"{whisper_model}.en"
+    return whisper_model
+
+
+def compile_encoder(model, device: str) -> None:
+    """Replace an openai-whisper model's encoder with a torch.compile'd version
+    
+    The encoder always sees a fixed 30 s fp16 mel window, so one warm-up call
+    captures the CUDA graph that every later chunk replays. Falls back to the
+    eager encoder when compilation fails.
+    """
+    import torch
+    from whisper.audio import N_FRAMES
+    
+    eager_encoder = model.encoder
+    try:
+        model.encoder = torch.compile(eager_encoder, mode="reduce-overhead")
+        with torch.no_grad():
+            model.encoder(torch.zeros(1, model.dims.n_mels, N_FRAMES,
+                                      device=device, dtype=torch.float16))
+        logger.debug("Whisper encoder compiled", device=device)
+    except Exception as e:
+        model.encoder = eager_encoder
+        logger.warning("Encoder compilation failed, using eager mode", error=str(e))
+
+
+def batched_pipeline_enabled() -> bool:
+    """Whether faster-whisper models run through BatchedInferencePipeline
+    
+    The pipeline builds its batches from VAD speech windows, so turning VAD
+    off falls back to the plain sequential WhisperModel.
+    """
+    return config.transcription.batch_size > 1 and config.transcription.vad_filter
 
 
-def transcribe_audio_chunks(chunks: List[AudioChunk], whisper_model: str) -> List[TranscriptSegment]:
-    """Transcribe multiple audio chunks and return segments"""
+def load_whisper_model(whisper_model: str, slot: int = 0):
+    """Load a Whisper model on the configured backend
+    
+    With several transcription workers, slot picks the GPU round-robin on CUDA
+    setups, and CPU threads are split evenly between the instances otherwise.
+    """
+    
+    backend = resolve_backend()
+    if whisper_model.startswith("distil-") and backend != "faster-whisper":
+        raise WhisperError(f"Whisper model '{whisper_model}' requires the faster-whisper backend")
     
-    logger.info("Starting chunk transcription",
-               total_chunks=len(chunks), model=whisper_model)
+    cpu_threads = max(1, (os.cpu_count() or 4) // config.transcription.workers)
     
-    # Load Whisper model once
     try:
-        model = whisper.load_model(whisper_model)
-        logger.debug("Whisper model loaded", model=whisper_model)
+        if backend == "faster-whisper":
+            # Quantized CTranslate2 kernels: int8 weights, fp16 activations on GPU
+            gpu_count = ctranslate2.get_cuda_device_count()
+            device = "cuda" if gpu_count > 0 else "cpu"
+            model = WhisperModel(
+                whisper_model,
+                device=device,
+                device_index=slot % gpu_count if gpu_count else 0,
+                compute_type="int8_float16" if device == "cuda" else "int8",
+                cpu_threads=cpu_threads if device == "cpu" else 0
+            )
+            if batched_pipeline_enabled():
+                # Decode many VAD windows per encoder/decoder launch
+                model = BatchedInferencePipeline(model=model)
+        elif backend == "whisper-cpp":
+            device = "cpu"
+            model = WhisperCppModel(whisper_model, n_threads=cpu_threads)
+        else:
+            # Imported here: torch and whisper take seconds to import and are
+            # not needed by the other backends or the download-only paths
+            import torch
+            import whisper
+            if cuda_available():
+                device = f"cuda:{slot % torch.cuda.device_count()}"
+            else:
+                device = "cpu"
+            model = whisper.load_model(whisper_model, device=device)
+            if device != "cpu" and config.transcription.compile_encoder:
+                compile_encoder(model, device)
     except Exception as e:
         raise WhisperError(f"Failed to load Whisper model '{whisper_model}': {e}")
     
-    segments = []
+    logger.debug("Whisper model loaded", model=whisper_model, backend=backend,
+                device=device, slot=slot)
+    return model
+
+
+# Loaded models live for the whole process; batch jobs share them.
+# Keyed by (model name, worker slot)
+_models: Dict[Tuple[str, int], Any] = {}
+_models_lock = threading.Lock()
+
+# One lock per instance: openai-whisper installs per-call KV-cache hooks on
+# the model and CTranslate2 sessions are not safe to share, so concurrent
+# calls on one instance would corrupt each other
+_inference_locks: Dict[Tuple[str, int], threading.Lock] = {}
+
+
+def get_whisper_model(whisper_model: str, slot: int = 0):
+    """Return the cached Whisper model for a worker slot, loading it on first use"""
+    key = (whisper_model, slot)
+    with _models_lock:
+        if key not in _models:
+            _models[key] = load_whisper_model(whisper_model, slot)
+            _inference_locks[key] = threading.Lock()
+        return _models[key]
+
+
+def transcribe_with_backend(model, audio_path: str,
+                            language: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """Run the loaded model's backend on one audio file
+    
+    Returns the stripped text and the spoken language, when the backend
+    reports it.
+    """
+    
+    # A known language skips detection, an extra encoder pass per file
+    language = language or config.transcription.language
+    
+    if FASTER_WHISPER_AVAILABLE and isinstance(model, (WhisperModel, BatchedInferencePipeline)):
+        options = {}
+        if isinstance(model, BatchedInferencePipeline):
+            # The batches are built from VAD speech windows, so VAD is never off here
+            options["batch_size"] = config.transcription.batch_size
+            options["vad_filter"] = True
+        else:
+            options["vad_filter"] = config.transcription.vad_filter
+            # Silero VAD drops silence and music; each speech window is decoded
+            # on its own so a hallucinated loop cannot carry into the next one
+            options["vad_parameters"] = {"max_speech_duration_s": 30}
+            options["condition_on_previous_text"] = False
+        
+        # segments is a lazy generator; inference runs as it is consumed
+        segments, info = model.transcribe(
+            audio_path,
+            language=language,
+            beam_size=1,
+            **options
+        )
+        return "".join(segment.text for segment in segments).strip(), info.language
+    
+    if WHISPER_CPP_AVAILABLE and isinstance(model, WhisperCppModel):
+        params = {"language": language} if language else {}
+        segments = model.transcribe(audio_path, **params)
+        return " ".join(segment.text.strip() for segment in segments).strip(), language
+    
+    import torch
+    import whisper
+    
+    # fp16 runs on tensor cores on GPU; CPU inference only supports fp32
+    on_gpu = model.device.type == "cuda"
+    audio = audio_path
+    if on_gpu:
+        # Hand Whisper the waveform on the GPU so the log-mel STFT for the
+        # whole file runs there, not per window on the CPU
+        audio = torch.from_numpy(whisper.load_audio(audio_path)).to(model.device)
+    
+    # Greedy decoding (openai-whisper's default) and no conditioning on the
+    # previous window, so a repetition loop cannot propagate
+    result = model.transcribe(
+        audio,
+        language=language,
+        fp16=on_gpu,
+        best_of=1,
+        condition_on_previous_text=False
+    )
+    if not result or not result.get("text"):
+        return "", language
+    return result["text"].strip(), result.get("language", language)
+
+
+def collapse_repetitions(text: str, max_period: int = 8, min_words: int = 8) -> str:
+    """Collapse runs of a phrase repeated back to back, Whisper's hallucination loop
+    
+    A run is a phrase of up to max_period words repeated at least three times
+    and spanning at least min_words words; it is replaced by a single copy.
+    """
+    words = text.split()
+    kept = []
+    collapsed = 0
+    i = 0
+    
+    while i < len(words):
+        run_end = None
+        for period in range(1, max_period + 1):
+            phrase = words[i:i + period]
+            if len(phrase) < period:
+                break
+            repeats = 1
+            while words[i + repeats * period:i + (repeats + 1) * period] == phrase:
+                repeats += 1
+            if repeats >= 3 and repeats * period >= min_words:
+                run_end = i + repeats * period
+                break
+        
+        if run_end is None:
+            kept.append(words[i])
+            i += 1
+        else:
+            kept.extend(phrase)
+            collapsed += run_end - i - len(phrase)
+            i = run_end
+    
+    if not collapsed:
+        return text
+    
+    logger.debug("Collapsed repeated phrases in transcript", words_removed=collapsed)
+    return " ".join(kept)
+
+
+def run_whisper(whisper_model: str, audio_path: str, slot: int = 0,
+                language: Optional[str] = None) -> Tuple[str, Optional[str]]:
+    """Transcribe one audio file on a worker slot's model, returning cleaned text and language"""
+    model = get_whisper_model(whisper_model, slot)
+    with _inference_locks[(whisper_model, slot)]:
+        text, language = transcribe_with_backend(model, audio_path, language)
+    return collapse_repetitions(text), language
+
+
+def transcribe_chunk(chunk: AudioChunk, whisper_model: str, slot: int = 0,
+                     language: Optional[str] = None) -> TranscriptSegment:
+    """Transcribe a single audio chunk and remove its file afterwards"""
+    
+    logger.debug("Transcribing chunk",
+                chunk_index=chunk.chunk_index + 1,
+                filepath=chunk.filepath,
+                slot=slot)
+    
+    # Empty segment on failure to maintain order
+    segment = TranscriptSegment(
+        text="",
+        chunk_index=chunk.chunk_index,
+        char_count=0
+    )
     
-    for chunk in chunks:
-        logger.debug("Transcribing chunk",
-                    chunk_index=chunk.chunk_index + 1,
-                    total=len(chunks),
-                    filepath=chunk.filepath)
+    try:
+        # Transcribe chunk naturally - no artificial timeouts (CLAUDE.md lesson)
+        chunk_text, chunk_language = run_whisper(whisper_model, chunk.filepath, slot, language)
         
-        try:
-            # Transcribe chunk naturally - no artificial timeouts (CLAUDE.md lesson)
-            result = model.transcribe(chunk.filepath, fp16=False)
+        if chunk_text:
+            segment = TranscriptSegment(
+                text=chunk_text,
+                chunk_index=chunk.chunk_index,
+                char_count=len(chunk_text),
+                language=chunk_language
+            )
             
-            if result and result.get("text"):
-                chunk_text = result["text"].strip()
-                
-                segment = TranscriptSegment(
-                    text=chunk_text,
-                    chunk_index=chunk.chunk_index,
-                    char_count=len(chunk_text)
-                )
-                segments.append(segment)
-                
-                logger.debug("Chunk transcribed successfully",
-                            chunk_index=chunk.chunk_index + 1,
-                            char_count=len(chunk_text))
-            else:
-                logger.warning("Chunk returned empty transcript",
-                              chunk_index=chunk.chunk_index + 1)
-                # Add empty segment to maintain order
-                segments.append(TranscriptSegment(
-                    text="",
-                    chunk_index=chunk.chunk_index,
-                    char_count=0
-                ))
-                
-        except Exception as e:
-            logger.error("Error transcribing chunk",
+            logger.debug("Chunk transcribed successfully",
                         chunk_index=chunk.chunk_index + 1,
-                        error=str(e))
-            # Add empty segment to maintain order
-            segments.append(TranscriptSegment(
-                text="",
-                chunk_index=chunk.chunk_index,
-                char_count=0
-            ))
-        
-        # Clean up chunk file after transcription
-        try:
-            os.remove(chunk.filepath)
-            logger.debug("Chunk file cleaned up", filepath=chunk.filepath)
-        except Exception as e:
-            logger.warning("Failed to clean up chunk file", 
-                          filepath=chunk.filepath, error=str(e))
+                        char_count=len(chunk_text))
+        else:
+            logger.warning("Chunk returned empty transcript",
+                          chunk_index=chunk.chunk_index + 1)
+            
+    except Exception as e:
+        logger.error("Error transcribing chunk",
+                    chunk_index=chunk.chunk_index + 1,
+                    error=str(e))
+    
+    # Clean up chunk file after transcription
+    try:
+        os.remove(chunk.filepath)
+        logger.debug("Chunk file cleaned up", filepath=chunk.filepath)
+    except Exception as e:
+        logger.warning("Failed to clean up chunk file", 
+                      filepath=chunk.filepath, error=str(e))
+    
+    return segment
+
+
+def transcribe_audio_chunks(chunks: Iterable[AudioChunk], whisper_model: str) -> List[TranscriptSegment]:
+    """Transcribe already-split audio chunks in order and return segments
+    
+    Chunks are independent, so with several workers they are spread
+    round-robin over one model instance per worker slot.
+    """
+    
+    workers = config.transcription.workers
+    logger.info("Starting chunk transcription", model=whisper_model, workers=workers)
+    
+    # Load every worker's model up front so a bad model fails fast
+    for slot in range(workers):
+        get_whisper_model(whisper_model, slot)
+    
+    chunks = iter(chunks)
+    segments = []
+    
+    # Whisper detects the language on every call; a video keeps one language,
+    # so the first chunk with speech decides it for all the others
+    language = config.transcription.language
+    if language is None:
+        for chunk in chunks:
+            segment = transcribe_chunk(chunk, whisper_model)
+            segments.append(segment)
+            if segment.text:
+                language = segment.language
+                logger.debug("Pinned transcription language", language=language,
+                            chunk_index=chunk.chunk_index + 1)
+                break
+    
+    if workers == 1:
+        segments += [transcribe_chunk(chunk, whisper_model, 0, language) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(transcribe_chunk, chunk, whisper_model, i % workers, language)
+                for i, chunk in enumerate(chunks)
+            ]
+            segments += [future.result() for future in futures]
     
     logger.info("Chunk transcription completed", total_segments=len(segments))
     return segments
@@ -340,30 +665,26 @@ def transcribe_audio_standard(audio_file: AudioFile, whisper_model: str) -> Tran
     logger.info("Starting standard transcription",
                filepath=audio_file.filepath, model=whisper_model)
     
-    try:
-        model = whisper.load_model(whisper_model)
-        logger.debug("Whisper model loaded", model=whisper_model)
-    except Exception as e:
-        raise WhisperError(f"Failed to load Whisper model '{whisper_model}': {e}")
+    get_whisper_model(whisper_model)
     
     try:
         # Transcribe naturally - no artificial timeouts (CLAUDE.md lesson)
-        result = model.transcribe(audio_file.filepath, fp16=False)
+        transcript_text, language = run_whisper(whisper_model, audio_file.filepath)
         
         # Verify transcription has content
-        if not result or not result.get("text"):
+        if not transcript_text:
             raise WhisperError("Transcription returned empty result")
         
-        transcript_text = result["text"].strip()
-        
         segment = TranscriptSegment(
             text=transcript_text,
             chunk_index=0,
-            char_count=len(transcript_text)
+            char_count=len(transcript_text),
+            language=language
         )
         
         logger.info("Standard transcription completed",
-                   char_count=len(transcript_text))
+                   char_count=len(transcript_text),
+                   language=language)
         
         return segment
         
@@ -385,15 +706,22 @@ def transcribe_audio(audio_file: AudioFile) -> Transcript:
         min_file_size_bytes=config.transcription.min_file_size_for_chunking
     )
     
+    # faster-whisper's batched pipeline splits the whole file into VAD speech
+    # windows and batches them itself, so ffmpeg chunks would only add
+    # subprocesses and shorter batches. Chunks are still needed to spread
+    # work over several model instances
+    batched = (resolve_backend() == "faster-whisper"
+               and batched_pipeline_enabled()
+               and config.transcription.workers == 1)
+    
     # Determine transcription strategy
-    if should_chunk_audio(audio_file, chunk_config):
+    if not batched and should_chunk_audio(audio_file, chunk_config):
         logger.info("Using chunked transcription strategy")
         
-        # Chunk the audio file
-        chunks = chunk_audio_file(audio_file, chunk_config)
-        
-        # Transcribe chunks
-        segments = transcribe_audio_chunks(chunks, config.transcription.whisper_model)
+        # Split in one ffmpeg pass before transcribing any chunk; chunk files are
+        # removed as they are transcribed
+        chunks = iter_audio_chunks(audio_file, chunk_config)
+        segments = transcribe_audio_chunks(chunks, resolve_whisper_model())
         
         # Combine segments
         combined_text = " ".join(segment.text for segment in segments if segment.text)
@@ -403,20 +731,21 @@ def transcribe_audio(audio_file: AudioFile) -> Transcript:
             segments=segments,
             video_info=audio_file.video_info,
             processing_method="chunked",
-            chunk_count=len(chunks)
+            chunk_count=len(segments)
         )
         
     else:
-        logger.info("Using standard transcription strategy")
+        method = "batched" if batched else "standard"
+        logger.info("Using single-pass transcription strategy", method=method)
         
         # Standard single-pass transcription
-        segment = transcribe_audio_standard(audio_file, config.transcription.whisper_model)
+        segment = transcribe_audio_standard(audio_file, resolve_whisper_model())
         
         transcript = Transcript(
             text=segment.text,
             segments=[segment],
             video_info=audio_file.video_info,
-            processing_method="standard",
+            processing_method=method,
             chunk_count=1
         )
     
@@ -433,4 +762,66 @@ def transcribe_audio(audio_file: AudioFile) -> Transcript:
                method=transcript.processing_method,
                char_count=transcript.char_count)
     
-    return transcript
\ No newline at end of file
+    return transcript
+
+
+_VTT_TAG = re.compile(r"<[^>]*>")
+
+
+def parse_vtt(vtt: str) -> str:
+    """Extract plain caption text from WebVTT
+    
+    YouTube's automatic captions roll: each cue repeats the previous line
+    before adding a new one, so a line equal to the last kept one is dropped.
+    """
+    
+    lines = []
+    for block in re.split(r"\n\s*\n", vtt.replace("\r\n", "\n")):
+        block_lines = block.strip().split("\n")
+        # Cue text follows the timing line; header, NOTE and STYLE blocks have none
+        for i, line in enumerate(block_lines):
+            if "-->" in line:
+                cue_lines = block_lines[i + 1:]
+                break
+        else:
+            continue
+        
+        for line in cue_lines:
+            text = html.unescape(_VTT_TAG.sub("", line)).strip()
+            if text and (not lines or text != lines[-1]):
+                lines.append(text)
+    
+    return " ".join(lines)
+
+
+def transcribe_from_captions(video_info: VideoInfo) -> Optional[Transcript]:
+    """Build a transcript from the video's YouTube captions, skipping audio entirely
+    
+    Returns None when the video has no usable captions, so the caller can fall
+    back to downloading and transcribing the audio.
+    """
+    
+    vtt = fetch_captions(video_info)
+    if not vtt:
+        return None
+    
+    text = parse_vtt(vtt)
+    if len(text) < 10:
+        logger.warning("Captions too short to use", video_id=video_info.video_id,
+                      char_count=len(text))
+        return None
+    
+    segment = TranscriptSegment(text=text, chunk_index=0, char_count=len(text))
+    transcript = Transcript(
+        text=text,
+        segments=[segment],
+        video_info=video_info,
+        processing_method="captions",
+        chunk_count=1
+    )
+    
+    logger.info("Transcript taken from captions",
+               video_id=video_info.video_id,
+               char_count=transcript.char_count)
+    
+    return transcript
@@ -9,18 +9,29 @@ Handles the complete pipeline: URL → Video Info → Audio → Transcript → A
 import sys
 import os
 import asyncio
+import atexit
 import csv
 import fcntl
+import io
+import threading
 import time
 import uuid
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 import structlog
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+# Try to import pyarrow for the Parquet job summary sink, CSV works without it
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -28,6 +39,7 @@ from config import config
 from core.download import (
     get_enhanced_video_info,
     download_audio,
+    cookies_available,
     VideoInfo,
     AudioFile,
     DownloadError,
@@ -36,6 +48,8 @@ from core.download import (
 )
 from core.transcribe import (
     transcribe_audio,
+    transcribe_from_captions,
+    resolve_whisper_model,
     Transcript,
     TranscriptionError,
     AudioProcessingError,
@@ -181,9 +195,9 @@ class ProcessingJob(BaseModel):
     
     def to_csv_row(self) -> Dict[str, Any]:
         """Convert job to CSV row format matching job_summary.csv"""
-        # Calculate word counts
-        transcript_word_count = len(self.transcript.text.split()) if self.transcript else None
-        processed_word_count = len(self.processed_transcript.processed_text.split()) if self.processed_transcript else None
+        # Word counts are computed once when the transcripts are built
+        transcript_word_count = self.transcript.word_count if self.transcript else None
+        processed_word_count = self.processed_transcript.word_count if self.processed_transcript else None
         
         # Get video duration in proper format
         video_duration = None
@@ -199,6 +213,10 @@ class ProcessingJob(BaseModel):
                     seconds = 0
             video_duration = f"{seconds // 60}:{seconds % 60:02d}"
         
+        # Cached responses report no usage of their own, so rows that used the
+        # cache are marked instead of understating tokens and cost
+        usage_cached = bool(self.processed_transcript and self.processed_transcript.cached_calls)
+        
         return {
             'job_id': self.job_id,
             'job_start_time': self.start_time.strftime('%Y-%m-%d %H:%M:%S'),
@@ -215,17 +233,17 @@ class ProcessingJob(BaseModel):
             'audio_file_size_mb': f"{self.audio_file_size_mb:.2f}" if self.audio_file_size_mb else '',
             'audio_chunks_created': self.audio_chunks_created if self.used_audio_chunking else '',
             'transcript_word_count': transcript_word_count,
-            'transcript_character_count': len(self.transcript.text) if self.transcript else '',
+            'transcript_character_count': self.transcript.char_count if self.transcript else '',
             'processed_word_count': processed_word_count if self.processed_transcript else '',
-            'processed_character_count': len(self.processed_transcript.processed_text) if self.processed_transcript else '',
+            'processed_character_count': self.processed_transcript.char_count if self.processed_transcript else '',
             'compression_ratio_percent': f"{(1 - self.processed_transcript.char_reduction_ratio) * 100:.2f}" if self.processed_transcript else '',
             'content_preservation_percent': f"{self.processed_transcript.char_reduction_ratio * 100:.2f}" if self.processed_transcript else '',
             'openai_model': config.processing.openai_model if self.processed_transcript else '',
-            'total_tokens_used': self.processed_transcript.total_tokens['total_tokens'] if self.processed_transcript else '',
-            'input_tokens': self.processed_transcript.total_tokens['input_tokens'] if self.processed_transcript else '',
-            'output_tokens': self.processed_transcript.total_tokens['output_tokens'] if self.processed_transcript else '',
+            'total_tokens_used': 'cached' if usage_cached else self.processed_transcript.total_tokens['total_tokens'] if self.processed_transcript else '',
+            'input_tokens': 'cached' if usage_cached else self.processed_transcript.total_tokens['input_tokens'] if self.processed_transcript else '',
+            'output_tokens': 'cached' if usage_cached else self.processed_transcript.total_tokens['output_tokens'] if self.processed_transcript else '',
             'api_calls_count': self.processed_transcript.processing_strategy.chunk_count if self.processed_transcript and self.used_text_chunking else 1 if self.processed_transcript else '',
-            'estimated_cost_usd': f"{self.calculate_cost_usd():.4f}" if self.processed_transcript else '',
+            'estimated_cost_usd': 'cached' if usage_cached else f"{self.calculate_cost_usd():.4f}" if self.processed_transcript else '',
             'used_audio_chunking': 'Yes' if self.used_audio_chunking else 'No',
             'used_text_chunking': 'Yes' if self.used_text_chunking else 'No',
             'retry_count': self.retry_count or '',
@@ -235,10 +253,42 @@ class ProcessingJob(BaseModel):
         }
 
 
+class Console:
+    """Buffered terminal output, written to stdout once per flush
+    
+    Collapses the many small progress lines into one write per stage, which
+    matters when output is piped, and keeps a job's lines together when
+    several jobs run concurrently.
+    """
+    
+    def __init__(self):
+        self.buffer = io.StringIO()
+        self.interactive = sys.stdout.isatty()
+    
+    def emit(self, line: str = ""):
+        """Queue a line for the next flush"""
+        self.buffer.write(line)
+        self.buffer.write("\n")
+    
+    def flush(self):
+        """Write all queued lines to stdout in a single call"""
+        output = self.buffer.getvalue()
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            self.buffer = io.StringIO()
+    
+    def refresh(self):
+        """Flush mid-stage status for a watching user; piped output waits for the stage end"""
+        if self.interactive:
+            self.flush()
+
+
 class ProgressTracker:
     """Enhanced progress tracking with structured logging"""
     
-    def __init__(self):
+    def __init__(self, console: Optional[Console] = None):
+        self.console = console or Console()
         self.current_step = ""
         self.total_steps = 4
         self.step_names = [
@@ -255,59 +305,78 @@ class ProgressTracker:
         self.current_step = self.step_names[step_index]
         progress = (step_index / self.total_steps) * 100
         
-        print(f"\n[{progress:.0f}%] {self.current_step}")
+        self.console.emit(f"\n[{progress:.0f}%] {self.current_step}")
         logger.info("Processing step started", 
                    step=self.current_step,
                    step_index=step_index,
                    progress_percent=progress)
+        self.console.refresh()
     
     def complete_step(self, step_index: int):
         """Complete a processing step"""
         progress = ((step_index + 1) / self.total_steps) * 100
         step_name = self.step_names[step_index]
         
-        print(f"[{progress:.0f}%] ✅ {step_name}")
+        self.console.emit(f"[{progress:.0f}%] ✅ {step_name}")
         logger.info("Processing step completed",
                    step=step_name,
                    step_index=step_index,
                    progress_percent=progress)
+        self.console.flush()
     
     def show_final_summary(self, job: ProcessingJob):
         """Show final job summary"""
-        print(f"\n{'='*60}")
-        print(f"🎉 Processing Complete!")
-        print(f"{'='*60}")
-        print(f"📹 Video: {job.video_info.title[:50]}...")
-        print(f"👤 Creator: {job.video_info.uploader}")
-        print(f"⏱️  Total Time: {job.duration_seconds():.1f}s")
-        print(f"📊 Status: {job.status}")
+        self.console.emit(f"\n{'='*60}")
+        self.console.emit(f"🎉 Processing Complete!")
+        self.console.emit(f"{'='*60}")
+        self.console.emit(f"📹 Video: {job.video_info.title[:50]}...")
+        self.console.emit(f"👤 Creator: {job.video_info.uploader}")
+        self.console.emit(f"⏱️  Total Time: {job.duration_seconds():.1f}s")
+        self.console.emit(f"📊 Status: {job.status}")
         
         if job.transcript:
-            print(f"📝 Transcript: {len(job.transcript.text):,} characters")
-            print(f"🎵 Audio Method: {job.transcript.processing_method}")
+            self.console.emit(f"📝 Transcript: {job.transcript.char_count:,} characters")
+            self.console.emit(f"🎵 Audio Method: {job.transcript.processing_method}")
             if job.transcript.chunk_count and job.transcript.chunk_count > 1:
-                print(f"🧩 Audio Chunks: {job.transcript.chunk_count}")
+                self.console.emit(f"🧩 Audio Chunks: {job.transcript.chunk_count}")
         
         if job.processed_transcript:
             pt = job.processed_transcript
-            print(f"🤖 AI Processing: {pt.processing_strategy.method}")
-            print(f"📄 Final Length: {len(pt.processed_text):,} characters")
-            print(f"💰 Tokens Used: {pt.total_tokens['total_tokens']:,}")
-            print(f"📉 Compression: {pt.char_reduction_ratio:.1%}")
+            self.console.emit(f"🤖 AI Processing: {pt.processing_strategy.method}")
+            self.console.emit(f"📄 Final Length: {pt.char_count:,} characters")
+            self.console.emit(f"💰 Tokens Used: {pt.total_tokens['total_tokens']:,}")
+            self.console.emit(f"📉 Compression: {pt.char_reduction_ratio:.1%}")
             if pt.processing_strategy.requires_chunking:
-                print(f"🧩 Text Chunks: {pt.processing_strategy.chunk_count}")
+                self.console.emit(f"🧩 Text Chunks: {pt.processing_strategy.chunk_count}")
+        
+        self.console.flush()
 
 
-def save_transcript_file(transcript: Transcript, job_id: str) -> Path:
+# Characters not allowed in filenames, all mapped to '_' in a single pass
+_FILENAME_TRANSLATION = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
+
+def write_file_atomic(path: Path, *parts: bytes) -> int:
+    """Write byte parts to a sibling temp file, rename it over the target, return the size"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        # Written in sequence so header and body are never concatenated in memory
+        for part in parts:
+            f.write(part)
+    os.replace(tmp_path, path)
+    return sum(len(part) for part in parts)
+
+
+def save_transcript_file(transcript: Transcript, job_id: str,
+                         console: Optional[Console] = None) -> Path:
     """Save raw transcript to file with metadata header"""
     
     logger.info("Saving transcript file", job_id=job_id)
+    console = console or Console()
     
     # Clean filename
     def clean_filename(name: str) -> str:
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '_')
+        name = name.translate(_FILENAME_TRANSLATION)
         name = ' '.join(name.split())  # Remove extra spaces
         return name[:100] if len(name) > 100 else name
     
@@ -316,47 +385,54 @@ def save_transcript_file(transcript: Transcript, job_id: str) -> Path:
     filename = f"{title}_{creator}_transcript.txt"
     
     # Create metadata header
-    generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    header = "===== VIDEO METADATA =====\n"
-    header += f"Title: {transcript.video_info.title}\n"
-    header += f"Creator: {transcript.video_info.uploader}\n"
-    header += f"Video ID: {transcript.video_info.video_id}\n"
-    header += f"URL: {transcript.video_info.url}\n"
+    generation_time = time.strftime('%Y-%m-%d %H:%M:%S')
+    video_info = transcript.video_info
+    
+    lines = [
+        "===== VIDEO METADATA =====",
+        f"Title: {video_info.title}",
+        f"Creator: {video_info.uploader}",
+        f"Video ID: {video_info.video_id}",
+        f"URL: {video_info.url}",
+    ]
     
     # Add enhanced metadata if available
-    if transcript.video_info.duration:
-        header += f"Duration: {transcript.video_info.duration}\n"
-    if transcript.video_info.view_count and transcript.video_info.view_count != '0':
-        header += f"Views: {transcript.video_info.view_count}\n"
-    if transcript.video_info.published_at:
-        header += f"Published: {transcript.video_info.published_at}\n"
-    if transcript.video_info.description:
-        header += f"Description: {transcript.video_info.description}\n"
-    
-    header += f"API Source: {transcript.video_info.api_source}\n"
-    header += "="*50 + "\n"
-    header += f"Generated: {generation_time}\n"
-    header += f"Job ID: {job_id}\n"
-    header += f"Tool: youtube_summarizer_v3 (clean architecture)\n"
-    header += f"Transcription Method: {transcript.processing_method}\n"
+    if video_info.duration:
+        lines.append(f"Duration: {video_info.duration}")
+    if video_info.view_count and video_info.view_count != '0':
+        lines.append(f"Views: {video_info.view_count}")
+    if video_info.published_at:
+        lines.append(f"Published: {video_info.published_at}")
+    if video_info.description:
+        lines.append(f"Description: {video_info.description}")
+    
+    lines += [
+        f"API Source: {video_info.api_source}",
+        "="*50,
+        f"Generated: {generation_time}",
+        f"Job ID: {job_id}",
+        "Tool: youtube_summarizer_v3 (clean architecture)",
+        f"Transcription Method: {transcript.processing_method}",
+    ]
     if transcript.chunk_count and transcript.chunk_count > 1:
-        header += f"Audio Chunks: {transcript.chunk_count}\n"
-    header += "="*50 + "\n\n"
+        lines.append(f"Audio Chunks: {transcript.chunk_count}")
+    lines.append("="*50)
+    
+    header = "\n".join(lines) + "\n\n"
     
     # Write file
     try:
         filepath = Path(filename)
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(header + transcript.text)
-        
-        file_size = filepath.stat().st_size
+        file_size = write_file_atomic(
+            filepath, header.encode('utf-8'), transcript.text.encode('utf-8')
+        )
         logger.info("Transcript file saved",
                    filepath=str(filepath),
                    size_kb=file_size / 1024)
         
-        print(f"📄 Transcript saved: {filepath}")
-        print(f"📏 File size: {file_size/1024:.1f} KB")
+        console.emit(f"📄 Transcript saved: {filepath}")
+        console.emit(f"📏 File size: {file_size/1024:.1f} KB")
+        console.flush()
         
         return filepath
         
@@ -365,54 +441,63 @@ def save_transcript_file(transcript: Transcript, job_id: str) -> Path:
         raise ProcessingError(f"Failed to save transcript: {e}")
 
 
-def save_processed_file(processed: ProcessedTranscript, original_file: Path, job_id: str) -> Path:
+def processed_file_path(transcript_file: Path) -> Path:
+    """Derive the processed output path from the saved transcript path"""
+    output_name = transcript_file.stem.replace('_transcript', '') + '_processed.txt'
+    return transcript_file.parent / output_name
+
+
+def save_processed_file(processed: ProcessedTranscript, original_file: Path, job_id: str,
+                        console: Optional[Console] = None) -> Path:
     """Save AI-processed transcript to file"""
     
     logger.info("Saving processed transcript file", job_id=job_id)
+    console = console or Console()
     
-    # Create output filename
-    output_name = original_file.stem.replace('_transcript', '') + '_processed.txt'
-    output_path = original_file.parent / output_name
+    output_path = processed_file_path(original_file)
     
     # Create processing metadata header
-    generation_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    # Start with original metadata if available
-    header = ""
-    
-    # Add processing metadata
-    header += "===== PROCESSING METADATA =====\n"
-    header += f"Original Length: {len(processed.original_transcript.text):,} characters\n"
-    header += f"Processed Length: {len(processed.processed_text):,} characters\n"
-    header += f"Compression Ratio: {processed.char_reduction_ratio:.1%}\n"
-    header += f"Processing Method: {processed.processing_strategy.method}\n"
-    header += f"AI Model: {config.processing.openai_model}\n"
-    header += f"Processing Time: {processed.processing_time:.1f}s\n"
-    header += f"Tokens Used: {processed.total_tokens['total_tokens']:,}\n"
-    header += f"Input Tokens: {processed.total_tokens['input_tokens']:,}\n"
-    header += f"Output Tokens: {processed.total_tokens['output_tokens']:,}\n"
+    generation_time = time.strftime('%Y-%m-%d %H:%M:%S')
+    tokens = processed.total_tokens
+    
+    lines = [
+        "===== PROCESSING METADATA =====",
+        f"Original Length: {processed.original_transcript.char_count:,} characters",
+        f"Processed Length: {processed.char_count:,} characters",
+        f"Compression Ratio: {processed.char_reduction_ratio:.1%}",
+        f"Processing Method: {processed.processing_strategy.method}",
+        f"AI Model: {config.processing.openai_model}",
+        f"Processing Time: {processed.processing_time:.1f}s",
+        f"Tokens Used: {tokens['total_tokens']:,}",
+        f"Input Tokens: {tokens['input_tokens']:,}",
+        f"Output Tokens: {tokens['output_tokens']:,}",
+    ]
     
     if processed.processing_strategy.requires_chunking:
-        header += f"Text Chunks: {processed.processing_strategy.chunk_count}\n"
-        header += f"Concurrent Processing: {config.processing.max_concurrent_chunks} max\n"
+        lines.append(f"Text Chunks: {processed.processing_strategy.chunk_count}")
+        lines.append(f"Concurrent Processing: {config.processing.max_concurrent_chunks} max")
+    
+    lines += [
+        f"Processing Date: {generation_time}",
+        f"Job ID: {job_id}",
+        "Tool: youtube_summarizer_v3 (clean architecture)",
+        "="*50,
+    ]
     
-    header += f"Processing Date: {generation_time}\n"
-    header += f"Job ID: {job_id}\n"
-    header += f"Tool: youtube_summarizer_v3 (clean architecture)\n"
-    header += "="*50 + "\n\n"
+    header = "\n".join(lines) + "\n\n"
     
     # Write processed file
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(header + processed.processed_text)
-        
-        file_size = output_path.stat().st_size
+        file_size = write_file_atomic(
+            output_path, header.encode('utf-8'), processed.processed_text.encode('utf-8')
+        )
         logger.info("Processed file saved",
                    filepath=str(output_path),
                    size_kb=file_size / 1024)
         
-        print(f"📄 Processed file saved: {output_path}")
-        print(f"📏 File size: {file_size/1024:.1f} KB")
+        console.emit(f"📄 Processed file saved: {output_path}")
+        console.emit(f"📏 File size: {file_size/1024:.1f} KB")
+        console.flush()
         
         return output_path
         
@@ -428,26 +513,27 @@ def generate_job_id() -> str:
     return f"{timestamp}_{unique_suffix}"
 
 
+# Column order shared by the CSV and Parquet job summary sinks
+_CSV_FIELDNAMES = [
+    'job_id', 'job_start_time', 'job_end_time', 'job_status',
+    'video_title', 'creator_name', 'video_duration', 'video_publish_date',
+    'total_processing_seconds', 'download_duration_seconds',
+    'transcription_duration_seconds', 'ai_processing_duration_seconds',
+    'audio_file_size_mb', 'audio_chunks_created',
+    'transcript_word_count', 'transcript_character_count',
+    'processed_word_count', 'processed_character_count',
+    'compression_ratio_percent', 'content_preservation_percent',
+    'openai_model', 'total_tokens_used', 'input_tokens', 'output_tokens',
+    'api_calls_count', 'estimated_cost_usd',
+    'used_audio_chunking', 'used_text_chunking', 'retry_count',
+    'whisper_model', 'youtube_api_used', 'cookie_auth_used'
+]
+
+
 def write_job_to_csv(job: ProcessingJob, csv_file: str = "job_summary.csv"):
     """Write job results to CSV file with thread-safe file locking"""
     csv_path = Path(csv_file)
     
-    # Get CSV headers from the first row or create new file
-    fieldnames = [
-        'job_id', 'job_start_time', 'job_end_time', 'job_status',
-        'video_title', 'creator_name', 'video_duration', 'video_publish_date',
-        'total_processing_seconds', 'download_duration_seconds',
-        'transcription_duration_seconds', 'ai_processing_duration_seconds',
-        'audio_file_size_mb', 'audio_chunks_created',
-        'transcript_word_count', 'transcript_character_count',
-        'processed_word_count', 'processed_character_count',
-        'compression_ratio_percent', 'content_preservation_percent',
-        'openai_model', 'total_tokens_used', 'input_tokens', 'output_tokens',
-        'api_calls_count', 'estimated_cost_usd',
-        'used_audio_chunking', 'used_text_chunking', 'retry_count',
-        'whisper_model', 'youtube_api_used', 'cookie_auth_used'
-    ]
-    
     # Convert job to CSV row
     row_data = job.to_csv_row()
     
@@ -458,7 +544,7 @@ def write_job_to_csv(job: ProcessingJob, csv_file: str = "job_summary.csv"):
         # Acquire exclusive lock
         fcntl.flock(csvfile.fileno(), fcntl.LOCK_EX)
         try:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=_CSV_FIELDNAMES)
             
             # Write header if file is new
             if not file_exists:
@@ -477,21 +563,105 @@ def write_job_to_csv(job: ProcessingJob, csv_file: str = "job_summary.csv"):
             fcntl.flock(csvfile.fileno(), fcntl.LOCK_UN)
 
 
+class ParquetJobWriter:
+    """Buffered zstd-compressed Parquet sink for job summary rows
+    
+    Parquet files cannot be appended to, so each process writes its own part
+    file into a dataset directory; readers load the directory as one table.
+    """
+    
+    def __init__(self, dataset_dir: str = "job_summary", flush_every: int = 50):
+        if not PYARROW_AVAILABLE:
+            raise ProcessingError("Parquet job summary requires pyarrow (pip install pyarrow)")
+        
+        self.dataset_dir = Path(dataset_dir)
+        self.flush_every = flush_every
+        self.schema = pa.schema([(name, pa.string()) for name in _CSV_FIELDNAMES])
+        self.rows: List[Dict[str, Any]] = []
+        self.writer = None
+        self.filepath: Optional[Path] = None
+        self.lock = threading.Lock()
+    
+    def write(self, job: ProcessingJob):
+        """Buffer a job row, flushing a row group once the buffer is full"""
+        row = job.to_csv_row()
+        with self.lock:
+            self.rows.append({name: '' if row.get(name) is None else str(row.get(name))
+                              for name in _CSV_FIELDNAMES})
+            if len(self.rows) >= self.flush_every:
+                self._flush()
+        
+        logger.info("Job saved to Parquet buffer",
+                   job_id=job.job_id,
+                   status=job.status,
+                   buffered_rows=len(self.rows))
+    
+    def _flush(self):
+        if not self.rows:
+            return
+        
+        if self.writer is None:
+            self.dataset_dir.mkdir(parents=True, exist_ok=True)
+            self.filepath = self.dataset_dir / f"part-{generate_job_id()}.parquet"
+            self.writer = pq.ParquetWriter(self.filepath, self.schema, compression='zstd')
+        
+        self.writer.write_table(pa.Table.from_pylist(self.rows, schema=self.schema))
+        logger.info("Job summary rows flushed to Parquet",
+                   filepath=str(self.filepath),
+                   rows=len(self.rows))
+        self.rows = []
+    
+    def close(self):
+        """Flush remaining rows and finalize the Parquet footer"""
+        with self.lock:
+            self._flush()
+            if self.writer is not None:
+                self.writer.close()
+                self.writer = None
+
+
+_parquet_writer: Optional[ParquetJobWriter] = None
+_parquet_writer_lock = threading.Lock()
+
+
+def get_parquet_writer() -> ParquetJobWriter:
+    """Create the process-wide Parquet sink on first use and close it at exit"""
+    global _parquet_writer
+    with _parquet_writer_lock:
+        if _parquet_writer is None:
+            _parquet_writer = ParquetJobWriter()
+            atexit.register(_parquet_writer.close)
+        return _parquet_writer
+
+
+def record_job(job: ProcessingJob):
+    """Write job results to the configured job summary sink"""
+    if config.job_summary_format == "parquet":
+        try:
+            get_parquet_writer().write(job)
+            return
+        except ProcessingError as e:
+            logger.warning("Parquet sink unavailable, falling back to CSV", error=str(e))
+    
+    write_job_to_csv(job)
+
+
 def process_youtube_video(url: str, skip_ai_processing: bool = False) -> ProcessingJob:
     """Main function to process a YouTube video through the complete pipeline"""
     
     job_id = generate_job_id()
-    progress = ProgressTracker()
+    console = Console()
+    progress = ProgressTracker(console)
     
     logger.info("Starting YouTube video processing",
                url=url,
                job_id=job_id,
                skip_ai=skip_ai_processing)
     
-    print(f"🎬 YouTube Summarizer v3 (Clean Architecture)")
-    print(f"📋 Job ID: {job_id}")
-    print(f"🔗 URL: {url}")
-    print("="*60)
+    console.emit(f"🎬 YouTube Summarizer v3 (Clean Architecture)")
+    console.emit(f"📋 Job ID: {job_id}")
+    console.emit(f"🔗 URL: {url}")
+    console.emit("="*60)
     
     # Create job object at the start
     job = ProcessingJob(job_id=job_id)
@@ -511,57 +681,66 @@ def process_youtube_video(url: str, skip_ai_processing: bool = False) -> Process
                    title=video_info.title[:50],
                    uploader=video_info.uploader)
         
-        print(f"📹 Video ID: {video_info.video_id}")
-        print(f"📺 Title: {video_info.title}")
-        print(f"👤 Creator: {video_info.uploader}")
+        console.emit(f"📹 Video ID: {video_info.video_id}")
+        console.emit(f"📺 Title: {video_info.title}")
+        console.emit(f"👤 Creator: {video_info.uploader}")
         if video_info.duration:
-            print(f"⏱️  Duration: {video_info.duration}")
+            console.emit(f"⏱️  Duration: {video_info.duration}")
         
         progress.complete_step(0)
         
-        # Step 2: Download audio
-        progress.start_step(1)
-        job.mark_download_start()
-        
-        audio_file = download_audio(video_info)
-        
-        job.mark_download_end()
-        job.audio_file_size_mb = audio_file.size_bytes / 1024 / 1024
-        job.cookie_auth_used = Path("youtube_cookies.txt").exists()
+        # YouTube's own captions make the download and Whisper steps unnecessary
+        transcript = transcribe_from_captions(video_info) if config.transcription.use_captions else None
         
-        logger.info("Audio download completed",
-                   filepath=audio_file.filepath,
-                   size_mb=audio_file.size_bytes / 1024 / 1024)
-        
-        print(f"🎵 Audio downloaded: {audio_file.size_bytes/1024/1024:.1f} MB")
-        progress.complete_step(1)
-        
-        # Step 3: Transcribe audio
-        progress.start_step(2)
-        job.mark_transcription_start()
-        
-        transcript = transcribe_audio(audio_file)
+        if transcript is not None:
+            job.whisper_model = "captions"
+            console.emit("💬 Using YouTube captions, skipping audio download and transcription")
+            progress.start_step(2)
+        else:
+            # Step 2: Download audio
+            progress.start_step(1)
+            job.mark_download_start()
+            
+            audio_file = download_audio(video_info)
+            
+            job.mark_download_end()
+            job.audio_file_size_mb = audio_file.size_bytes / 1024 / 1024
+            job.cookie_auth_used = cookies_available()
+            
+            logger.info("Audio download completed",
+                       filepath=audio_file.filepath,
+                       size_mb=audio_file.size_bytes / 1024 / 1024)
+            
+            console.emit(f"🎵 Audio downloaded: {audio_file.size_bytes/1024/1024:.1f} MB")
+            progress.complete_step(1)
+            
+            # Step 3: Transcribe audio
+            progress.start_step(2)
+            job.mark_transcription_start()
+            
+            transcript = transcribe_audio(audio_file)
+            
+            job.mark_transcription_end()
+            job.whisper_model = resolve_whisper_model()
         
-        job.mark_transcription_end()
         job.transcript = transcript
-        job.whisper_model = config.transcription.whisper_model
         job.used_audio_chunking = transcript.processing_method == "chunked"
         if job.used_audio_chunking:
             job.audio_chunks_created = transcript.chunk_count or 0
         
         logger.info("Transcription completed",
-                   char_count=len(transcript.text),
+                   char_count=transcript.char_count,
                    method=transcript.processing_method)
         
-        print(f"📝 Transcription complete: {len(transcript.text):,} characters")
-        print(f"🎯 Method: {transcript.processing_method}")
+        console.emit(f"📝 Transcription complete: {transcript.char_count:,} characters")
+        console.emit(f"🎯 Method: {transcript.processing_method}")
         if transcript.chunk_count and transcript.chunk_count > 1:
-            print(f"🧩 Audio chunks processed: {transcript.chunk_count}")
+            console.emit(f"🧩 Audio chunks processed: {transcript.chunk_count}")
         
         progress.complete_step(2)
         
         # Save transcript file
-        transcript_file = save_transcript_file(transcript, job_id)
+        transcript_file = save_transcript_file(transcript, job_id, console)
         
         # Step 4: AI Processing (optional)
         if not skip_ai_processing:
@@ -569,9 +748,13 @@ def process_youtube_video(url: str, skip_ai_processing: bool = False) -> Process
             job.mark_ai_processing_start()
             
             logger.info("Starting AI processing")
-            print(f"\n🤖 Starting AI processing with {config.processing.openai_model}...")
+            console.emit(f"\n🤖 Starting AI processing with {config.processing.openai_model}...")
+            console.refresh()
             
-            processed_transcript = process_transcript(transcript)
+            # With --stream the body lands in the output file while it is
+            # generated; save_processed_file then replaces it with the final version
+            stream_path = processed_file_path(transcript_file) if config.processing.stream_responses else None
+            processed_transcript = process_transcript(transcript, stream_path=stream_path)
             
             job.mark_ai_processing_end()
             job.processed_transcript = processed_transcript
@@ -581,23 +764,23 @@ def process_youtube_video(url: str, skip_ai_processing: bool = False) -> Process
                        method=processed_transcript.processing_strategy.method,
                        tokens=processed_transcript.total_tokens['total_tokens'])
             
-            print(f"🎯 Processing method: {processed_transcript.processing_strategy.method}")
-            print(f"💰 Tokens used: {processed_transcript.total_tokens['total_tokens']:,}")
-            print(f"📉 Content compression: {processed_transcript.char_reduction_ratio:.1%}")
+            console.emit(f"🎯 Processing method: {processed_transcript.processing_strategy.method}")
+            console.emit(f"💰 Tokens used: {processed_transcript.total_tokens['total_tokens']:,}")
+            console.emit(f"📉 Content compression: {processed_transcript.char_reduction_ratio:.1%}")
             
             # Save processed file
-            processed_file = save_processed_file(processed_transcript, transcript_file, job_id)
+            processed_file = save_processed_file(processed_transcript, transcript_file, job_id, console)
             
             progress.complete_step(3)
         else:
-            print(f"\n⏭️  Skipping AI processing (--transcript-only mode)")
+            console.emit(f"\n⏭️  Skipping AI processing (--transcript-only mode)")
             logger.info("AI processing skipped by user request")
         
         # Mark job as completed
         job.mark_completed()
         
-        # Write job to CSV
-        write_job_to_csv(job)
+        # Write job to the summary sink
+        record_job(job)
         
         # Show final summary
         progress.show_final_summary(job)
@@ -607,61 +790,164 @@ def process_youtube_video(url: str, skip_ai_processing: bool = False) -> Process
     except (DownloadError, NetworkError, YouTubeError) as e:
         error_msg = f"Download error: {e}"
         logger.error("Download failed", error=str(e))
-        print(f"\n❌ {error_msg}")
+        console.emit(f"\n❌ {error_msg}")
+        console.flush()
         
         job.mark_failed(error_msg)
-        write_job_to_csv(job)
+        record_job(job)
         return job
         
     except (TranscriptionError, AudioProcessingError, WhisperError) as e:
         error_msg = f"Transcription error: {e}"
         logger.error("Transcription failed", error=str(e))
-        print(f"\n❌ {error_msg}")
+        console.emit(f"\n❌ {error_msg}")
+        console.flush()
         
         job.mark_failed(error_msg)
-        write_job_to_csv(job)
+        record_job(job)
         return job
         
     except (ProcessingError, APIError, ChunkingError) as e:
         error_msg = f"AI processing error: {e}"
         logger.error("AI processing failed", error=str(e))
-        print(f"\n❌ {error_msg}")
+        console.emit(f"\n❌ {error_msg}")
+        console.flush()
         
         # Even if AI processing fails, we still have the transcript
         job.mark_failed(error_msg)
-        write_job_to_csv(job)
+        record_job(job)
         return job
         
     except Exception as e:
         error_msg = f"Unexpected error: {e}"
         logger.error("Unexpected error occurred", error=str(e))
-        print(f"\n❌ {error_msg}")
+        console.emit(f"\n❌ {error_msg}")
+        console.flush()
         
         job.mark_failed(error_msg)
-        write_job_to_csv(job)
+        record_job(job)
         return job
 
 
-def main():
-    """Main entry point with argument parsing"""
+async def process_youtube_videos(urls: List[str], skip_ai_processing: bool = False,
+                                 max_concurrent: Optional[int] = None) -> List[ProcessingJob]:
+    """Process several videos concurrently, each pipeline running in a worker thread"""
+    
+    max_concurrent = max_concurrent or config.max_concurrent_jobs
+    
+    logger.info("Starting batch processing",
+               total_urls=len(urls),
+               max_concurrent=max_concurrent)
+    
+    # Bound the number of pipelines in flight (download, Whisper and OpenAI per job)
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def process_with_semaphore(url: str) -> ProcessingJob:
+        async with semaphore:
+            return await asyncio.to_thread(process_youtube_video, url, skip_ai_processing)
+    
+    # Results keep the order of the input URLs
+    jobs = await asyncio.gather(*(process_with_semaphore(url) for url in urls))
+    
+    completed = sum(1 for job in jobs if job.status == "completed")
+    logger.info("Batch processing completed",
+               total_jobs=len(jobs),
+               completed=completed,
+               failed=len(jobs) - completed)
+    
+    return list(jobs)
+
+
+def read_urls_file(path: str) -> List[str]:
+    """Read one URL per line, ignoring blank lines and # comments"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f
+                if line.strip() and not line.strip().startswith('#')]
+
+
+def main() -> int:
+    """Main entry point with argument parsing, returning the process exit code"""
     
     if len(sys.argv) < 2:
-        print("Usage: python main.py <youtube_url> [--transcript-only]")
+        print("Usage: python main.py <youtube_url> [<youtube_url> ...] [--urls-file FILE] [--transcript-only]")
+        print("                      [--csv-format {csv,parquet}] [--batch-api] [--stream] [--cache|--no-cache] [--no-captions] [--lang CODE]")
         print("       python main.py <youtube_url>                    # Full processing with AI")
         print("       python main.py <youtube_url> --transcript-only  # Skip AI processing")
+        print("       python main.py --urls-file urls.txt             # Batch process one URL per line")
+        print("       python main.py --urls-file urls.txt --csv-format parquet  # zstd Parquet job summary")
+        print("       python main.py <youtube_url> --batch-api        # Use the OpenAI Batch API for long transcripts")
+        print("       python main.py <youtube_url> --stream           # Stream AI output to disk as it is generated")
+        print("       python main.py <youtube_url> --cache            # Reuse AI responses cached on disk (dev/tuning)")
+        print("       python main.py <youtube_url> --no-cache         # Bypass the cache even if enabled in .env")
+        print("       python main.py <youtube_url> --no-captions      # Transcribe audio even if captions exist")
+        print("       python main.py <youtube_url> --lang en          # Known language: skip detection, use .en models")
         print()
         print("Examples:")
         print("  python main.py https://www.youtube.com/watch?v=dQw4w9WgXcQ")
         print("  python main.py https://youtu.be/dQw4w9WgXcQ --transcript-only")
-        sys.exit(1)
-    
-    url = sys.argv[1]
-    skip_ai = "--transcript-only" in sys.argv
+        print("  python main.py https://youtu.be/dQw4w9WgXcQ https://youtu.be/9bZkp7q19f0")
+        return 1
+    
+    args = sys.argv[1:]
+    skip_ai = "--transcript-only" in args
+    if "--batch-api" in args:
+        config.processing.use_batch_api = True
+    if "--stream" in args:
+        config.processing.stream_responses = True
+    if "--cache" in args:
+        config.processing.response_cache = True
+    if "--no-cache" in args:
+        config.processing.response_cache = False
+    if "--no-captions" in args:
+        config.transcription.use_captions = False
+    
+    urls = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--urls-file":
+            if i + 1 >= len(args):
+                print("❌ Error: --urls-file requires a file path")
+                return 1
+            try:
+                urls.extend(read_urls_file(args[i + 1]))
+            except OSError as e:
+                print(f"❌ Error: Could not read URLs file: {e}")
+                return 1
+            i += 2
+            continue
+        if arg == "--csv-format":
+            if i + 1 >= len(args) or args[i + 1] not in ("csv", "parquet"):
+                print("❌ Error: --csv-format must be 'csv' or 'parquet'")
+                return 1
+            config.job_summary_format = args[i + 1]
+            i += 2
+            continue
+        if arg == "--lang":
+            if i + 1 >= len(args) or args[i + 1].startswith("--"):
+                print("❌ Error: --lang requires a language code (e.g. en)")
+                return 1
+            config.transcription.language = args[i + 1]
+            i += 2
+            continue
+        if not arg.startswith("--"):
+            urls.append(arg)
+        i += 1
+    
+    if not urls:
+        print("❌ Error: Please provide at least one YouTube URL")
+        return 1
     
     # Validate URL format
-    if not any(domain in url for domain in ['youtube.com', 'youtu.be']):
-        print("❌ Error: Please provide a valid YouTube URL")
-        sys.exit(1)
+    for url in urls:
+        if not any(domain in url for domain in ['youtube.com', 'youtu.be']):
+            print(f"❌ Error: Please provide a valid YouTube URL: {url}")
+            return 1
+    
+    # Fail before downloading anything rather than after transcription
+    if not skip_ai and not config.processing.openai_api_key:
+        print("❌ Error: OpenAI API key not configured (set OPENAI_API_KEY or use --transcript-only)")
+        return 1
     
     # Show configuration info
     if config.debug:
@@ -670,17 +956,31 @@ def main():
         print(f"🎵 Whisper Model: {config.transcription.whisper_model}")
         print()
     
-    # Process the video
-    job = process_youtube_video(url, skip_ai_processing=skip_ai)
+    if len(urls) == 1:
+        # Process the video
+        job = process_youtube_video(urls[0], skip_ai_processing=skip_ai)
+        
+        # Exit with appropriate code
+        if job.status == "completed":
+            print(f"\n✨ Processing completed successfully!")
+            return 0
+        else:
+            print(f"\n💥 Processing failed: {job.error_message}")
+            return 1
+    
+    # Process the batch concurrently
+    jobs = asyncio.run(process_youtube_videos(urls, skip_ai_processing=skip_ai))
+    
+    failed = [job for job in jobs if job.status != "completed"]
+    console = Console()
+    console.emit(f"\n{'='*60}")
+    console.emit(f"📦 Batch Complete: {len(jobs) - len(failed)}/{len(jobs)} succeeded")
+    for job in failed:
+        console.emit(f"💥 {job.job_id}: {job.error_message}")
+    console.flush()
     
-    # Exit with appropriate code
-    if job.status == "completed":
-        print(f"\n✨ Processing completed successfully!")
-        sys.exit(0)
-    else:
-        print(f"\n💥 Processing failed: {job.error_message}")
-        sys.exit(1)
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
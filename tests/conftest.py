@@ -0,0 +1,6 @@
+"""Shared pytest setup: make the project modules importable from the tests directory"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,90 @@
+"""Tests for the YouTube captions fast path"""
+
+import core.download as download
+import core.transcribe as transcribe
+from config import config
+from core.download import VideoInfo, select_caption_track
+
+
+def vtt_track(url: str) -> list:
+    return [{'ext': 'json3', 'url': url + '.json3'}, {'ext': 'vtt', 'url': url}]
+
+
+def make_video_info() -> VideoInfo:
+    return VideoInfo(
+        video_id='dQw4w9WgXcQ',
+        title='Test video',
+        uploader='Test channel',
+        url='https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+    )
+
+
+def test_manual_subtitles_preferred_over_automatic_captions():
+    info = {
+        'language': 'en',
+        'subtitles': {'en': vtt_track('manual')},
+        'automatic_captions': {'en': vtt_track('auto')},
+    }
+    assert select_caption_track(info, 'en')['url'] == 'manual'
+
+
+def test_automatic_captions_used_in_original_language():
+    info = {'language': 'en', 'automatic_captions': {'en': vtt_track('auto')}}
+    assert select_caption_track(info, 'en')['url'] == 'auto'
+
+
+def test_original_track_used_when_video_language_unknown():
+    info = {'automatic_captions': {'en': vtt_track('translated'), 'en-orig': vtt_track('orig')}}
+    assert select_caption_track(info, 'en')['url'] == 'orig'
+
+
+def test_translated_automatic_captions_rejected():
+    info = {
+        'language': 'de',
+        'subtitles': {},
+        'automatic_captions': {'en': vtt_track('translated'), 'de-orig': vtt_track('orig')},
+    }
+    assert select_caption_track(info, 'en') is None
+
+
+def test_translated_captions_fall_back_to_audio_transcription(monkeypatch):
+    info = {
+        'language': 'de',
+        'subtitles': {},
+        'automatic_captions': {'en': vtt_track('translated'), 'de-orig': vtt_track('orig')},
+    }
+    monkeypatch.setattr(download, 'extract_info_cached', lambda url: info)
+    monkeypatch.setattr(config.transcription, 'language', None)
+    monkeypatch.setattr(config.transcription, 'caption_language', 'en')
+
+    def fail_urlopen(*args, **kwargs):
+        raise AssertionError("translated captions must not be fetched")
+
+    monkeypatch.setattr(download.yt_dlp.YoutubeDL, 'urlopen', fail_urlopen)
+
+    # None tells process_youtube_video to download and transcribe the audio
+    assert transcribe.transcribe_from_captions(make_video_info()) is None
+
+
+def test_transcription_language_overrides_caption_language(monkeypatch):
+    info = {'language': 'de', 'automatic_captions': {'de-orig': vtt_track('orig')}}
+    monkeypatch.setattr(download, 'extract_info_cached', lambda url: info)
+    monkeypatch.setattr(config.transcription, 'language', 'de')
+    monkeypatch.setattr(config.transcription, 'caption_language', 'en')
+
+    requested = []
+
+    class FakeResponse:
+        def read(self):
+            return b"WEBVTT\n\n00:00:00.000 --> 00:00:02.000\nGuten Tag zusammen\n"
+
+    def fake_urlopen(self, url):
+        requested.append(url)
+        return FakeResponse()
+
+    monkeypatch.setattr(download.yt_dlp.YoutubeDL, 'urlopen', fake_urlopen)
+
+    transcript = transcribe.transcribe_from_captions(make_video_info())
+    assert requested == ['orig']
+    assert transcript.text == "Guten Tag zusammen"
+    assert transcript.processing_method == "captions"
@@ -0,0 +1,23 @@
+"""Tests for locating the finished audio download"""
+
+from core.download import find_downloaded_audio
+
+
+def write_file(path, size: int):
+    path.write_bytes(b"\0" * size)
+
+
+def test_stale_chunk_files_are_never_picked(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_file(tmp_path / "dQw4w9WgXcQ_audio.webm", 5000)
+    write_file(tmp_path / "dQw4w9WgXcQ_audio_chunk_001.webm", 50000)
+    write_file(tmp_path / "dQw4w9WgXcQ_audio.webm.part", 90000)
+
+    assert find_downloaded_audio("dQw4w9WgXcQ_audio") == (5000, "dQw4w9WgXcQ_audio.webm")
+
+
+def test_only_chunk_leftovers_means_no_download(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_file(tmp_path / "dQw4w9WgXcQ_audio_chunk_001.webm", 50000)
+
+    assert find_downloaded_audio("dQw4w9WgXcQ_audio") == (0, None)
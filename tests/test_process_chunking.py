@@ -0,0 +1,60 @@
+"""Tests for transcript chunking when the tiktoken encoding cannot be loaded"""
+
+import pytest
+
+import core.process as process
+from config import config
+from core.download import VideoInfo
+from core.transcribe import Transcript
+
+
+@pytest.fixture
+def offline_tiktoken(monkeypatch):
+    """Installed tiktoken whose BPE download fails, as on a firewalled host"""
+    calls = []
+
+    def fail_load(model):
+        calls.append(model)
+        raise ConnectionError("could not fetch o200k_base.tiktoken")
+
+    monkeypatch.setattr(process, "TIKTOKEN_AVAILABLE", True)
+    monkeypatch.setattr(process, "load_token_encoder", fail_load)
+    process.get_token_encoder.cache_clear()
+    yield calls
+    process.get_token_encoder.cache_clear()
+
+
+def make_transcript(text: str) -> Transcript:
+    video_info = VideoInfo(
+        video_id='dQw4w9WgXcQ',
+        title='Test video',
+        uploader='Test channel',
+        url='https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+    )
+    return Transcript(text=text, segments=[], video_info=video_info, processing_method="test")
+
+
+def test_encoder_failure_falls_back_to_character_chunking(offline_tiktoken, monkeypatch):
+    monkeypatch.setattr(config.processing, "chunk_size", 1000)
+    monkeypatch.setattr(config.processing, "chunk_overlap", 100)
+    text = "This sentence pads the transcript. " * 200
+
+    chunks = process.chunk_transcript_text(text)
+
+    assert len(chunks) > 1
+    # Character chunks carry the configured overlap between neighbours
+    assert chunks[1].overlap_start == 100
+    assert process.get_token_encoder(config.processing.openai_model) is None
+
+
+def test_encoder_failure_uses_character_estimates(offline_tiktoken, monkeypatch):
+    monkeypatch.setattr(config.processing, "chunking_threshold", 1000)
+    text = "This sentence pads the transcript. " * 200
+
+    strategy = process.determine_processing_strategy(make_transcript(text))
+    limit = process.output_token_limit([{"role": "user", "content": text}])
+
+    assert strategy.requires_chunking
+    assert limit == min(config.processing.max_output_tokens, len(text))
+    # The failed load is cached rather than retried on every call
+    assert len(offline_tiktoken) == 1
@@ -0,0 +1,29 @@
+"""Tests for sorting OpenAI failures into retryable and terminal errors"""
+
+import httpx
+import openai
+
+from core.process import APIError, ProcessingError, classify_api_error
+
+
+def rate_limit_error(code: str) -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, request=request)
+    body = {"message": "Request failed", "type": "requests", "code": code}
+    return openai.RateLimitError("Error code: 429", response=response, body=body)
+
+
+def test_rate_limit_is_retried():
+    error = classify_api_error(rate_limit_error("rate_limit_exceeded"))
+    assert isinstance(error, APIError)
+
+
+def test_insufficient_quota_is_terminal():
+    error = classify_api_error(rate_limit_error("insufficient_quota"))
+    assert isinstance(error, ProcessingError)
+    assert not isinstance(error, APIError)
+
+
+def test_unknown_exception_mentioning_timeout_is_terminal():
+    error = classify_api_error(ValueError("invalid timeout value in prompt"))
+    assert not isinstance(error, APIError)
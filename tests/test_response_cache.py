@@ -0,0 +1,71 @@
+"""Tests for the opt-in on-disk AI response cache"""
+
+import pytest
+
+import core.process as process
+from config import config
+from core.download import VideoInfo
+from core.process import ProcessedTranscript, ProcessingStrategy
+from core.transcribe import Transcript
+from main import ProcessingJob
+
+MESSAGES = [
+    {"role": "system", "content": "Summarize the transcript."},
+    {"role": "user", "content": "A transcript long enough to process."},
+]
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(config.processing, "response_cache", True)
+    monkeypatch.setattr(config.processing, "cache_dir", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_is_off_by_default():
+    assert type(config.processing).model_fields["response_cache"].default is False
+
+
+def test_complete_response_is_cached(response_cache):
+    process.write_cached_response(MESSAGES, "Structured summary text", "stop")
+    assert process.read_cached_response(MESSAGES) == "Structured summary text"
+
+
+def test_truncated_response_is_not_cached(response_cache):
+    process.write_cached_response(MESSAGES, "Structured summary cut off at", "length")
+    assert process.read_cached_response(MESSAGES) is None
+    assert list(response_cache.iterdir()) == []
+
+
+def make_processed_transcript(cached_calls: int) -> ProcessedTranscript:
+    video_info = VideoInfo(
+        video_id='dQw4w9WgXcQ',
+        title='Test video',
+        uploader='Test channel',
+        url='https://www.youtube.com/watch?v=dQw4w9WgXcQ'
+    )
+    text = "A transcript long enough to process."
+    transcript = Transcript(text=text, segments=[], video_info=video_info, processing_method="test")
+    return ProcessedTranscript(
+        processed_text="Structured summary text",
+        original_transcript=transcript,
+        processing_strategy=ProcessingStrategy(method="single_pass", requires_chunking=False),
+        total_tokens={'input_tokens': 0, 'output_tokens': 0, 'total_tokens': 0},
+        cached_calls=cached_calls,
+        processing_time=0.0,
+        char_reduction_ratio=0.5
+    )
+
+
+def test_cached_job_summary_row_is_marked_not_zeroed():
+    job = ProcessingJob(job_id="test", processed_transcript=make_processed_transcript(1))
+    row = job.to_csv_row()
+    assert row['total_tokens_used'] == 'cached'
+    assert row['estimated_cost_usd'] == 'cached'
+
+
+def test_uncached_job_summary_row_reports_usage():
+    job = ProcessingJob(job_id="test", processed_transcript=make_processed_transcript(0))
+    row = job.to_csv_row()
+    assert row['total_tokens_used'] == 0
+    assert row['estimated_cost_usd'] == "0.0000"
@@ -0,0 +1,83 @@
+"""Tests for faster-whisper model setup and backend options"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import core.transcribe as transcribe
+from config import config
+
+
+class FakeWhisperModel:
+    """Stands in for faster_whisper.WhisperModel, recording transcribe() options"""
+
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+
+    def transcribe(self, audio_path, **options):
+        self.calls.append(options)
+        segments = iter([SimpleNamespace(text=" hello"), SimpleNamespace(text=" world")])
+        return segments, SimpleNamespace(language="en")
+
+
+class FakeBatchedInferencePipeline(FakeWhisperModel):
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+
+
+def use_fake_faster_whisper(monkeypatch, batch_size: int, vad_filter: bool):
+    monkeypatch.setattr(transcribe, "FASTER_WHISPER_AVAILABLE", True)
+    monkeypatch.setattr(transcribe, "WhisperModel", FakeWhisperModel, raising=False)
+    monkeypatch.setattr(transcribe, "BatchedInferencePipeline", FakeBatchedInferencePipeline,
+                        raising=False)
+    monkeypatch.setattr(transcribe, "ctranslate2",
+                        SimpleNamespace(get_cuda_device_count=lambda: 0), raising=False)
+    monkeypatch.setattr(transcribe, "resolve_backend", lambda: "faster-whisper")
+    monkeypatch.setattr(config.transcription, "batch_size", batch_size)
+    monkeypatch.setattr(config.transcription, "vad_filter", vad_filter)
+
+
+def test_batched_pipeline_always_runs_with_vad(monkeypatch):
+    use_fake_faster_whisper(monkeypatch, batch_size=16, vad_filter=True)
+
+    model = transcribe.load_whisper_model("base")
+    assert isinstance(model, FakeBatchedInferencePipeline)
+
+    text, language = transcribe.transcribe_with_backend(model, "audio.webm")
+    assert text == "hello world"
+    assert language == "en"
+    assert model.calls[0]["vad_filter"] is True
+    assert model.calls[0]["batch_size"] == 16
+
+
+def test_disabling_vad_falls_back_to_sequential_model(monkeypatch):
+    use_fake_faster_whisper(monkeypatch, batch_size=16, vad_filter=False)
+
+    model = transcribe.load_whisper_model("base")
+    assert type(model) is FakeWhisperModel
+    assert not transcribe.batched_pipeline_enabled()
+
+    text, _ = transcribe.transcribe_with_backend(model, "audio.webm")
+    assert text == "hello world"
+    assert model.calls[0]["vad_filter"] is False
+    assert "batch_size" not in model.calls[0]
+
+
+@pytest.mark.parametrize("cuda_devices, language, expected", [
+    (1, "en", "distil-large-v3"),
+    (1, None, "base"),
+    (1, "de", "base"),
+    (0, "en", "distil-small.en"),
+    (0, None, "base"),
+    (0, "de", "base"),
+])
+def test_auto_model_uses_distilled_checkpoints_only_for_english(monkeypatch, cuda_devices,
+                                                                language, expected):
+    use_fake_faster_whisper(monkeypatch, batch_size=1, vad_filter=True)
+    monkeypatch.setattr(transcribe, "ctranslate2",
+                        SimpleNamespace(get_cuda_device_count=lambda: cuda_devices), raising=False)
+    monkeypatch.setattr(config.transcription, "whisper_model", "auto")
+    monkeypatch.setattr(config.transcription, "language", language)
+
+    assert transcribe.resolve_whisper_model() == expected